@@ -0,0 +1,51 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Time the quoted-strings rule on a file with 100k scalars.
+
+Run with ``python -m tests.benchmarks.quoted_strings``.
+"""
+
+import time
+
+from yamllint import linter
+from yamllint.config import YamlLintConfig
+
+VALUES = ('"hello world"', "'no need'", '"a: b"', 'plain', '"1.0"',
+          '"true"', '"{x}"', "'it''s'", '"#tag"', '"- item"')
+
+
+def build_document(count=100_000):
+    lines = []
+    for i in range(count // 2):
+        lines.append(f'key{i}: {VALUES[i % len(VALUES)]}')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    conf = YamlLintConfig('rules:\n'
+                          '  quoted-strings:\n'
+                          '    quote-type: any\n'
+                          '    required: only-when-needed\n'
+                          '    extra-allowed: [^1\\.]\n')
+    document = build_document()
+    start = time.perf_counter()
+    problems = list(linter.run(document, conf))
+    elapsed = time.perf_counter() - start
+    print(f'{len(problems)} problems in {elapsed:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
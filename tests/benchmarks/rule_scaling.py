@@ -0,0 +1,64 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Time rules that must run in linear time on sources of growing sizes.
+
+Run with ``python -m tests.benchmarks.rule_scaling``. The time of each rule
+should be about 4 times longer on a source 4 times bigger.
+"""
+
+import time
+from unittest import mock
+
+import yamllint.rules
+from yamllint import linter, parser
+from yamllint.config import YamlLintConfig
+
+SOURCES = {
+    'key-duplicates': lambda n: ''.join(f'key{i}: {i}\n' for i in range(n)),
+    'key-ordering': lambda n: ''.join(f'key{i:06}: {i}\n' for i in range(n)),
+    'alias-expansion': lambda n: '---\n- &a0 x\n' + ''.join(
+        f'- &a{i} [*a{i - 1}, *a{i - 1}]\n' for i in range(1, n)),
+    'document-complexity': lambda n: '---\n[' + ', '.join(
+        f'{{a: [{i}]}}' for i in range(n)) + ']\n',
+}
+
+
+def duration(rule_id, source):
+    """Times the rule alone, with tokens scanned beforehand."""
+    conf = YamlLintConfig(f'rules: {{{rule_id}: enable}}')
+    rule = yamllint.rules.get(rule_id)
+    elems = list(parser.token_or_comment_generator(source))
+    durations = []
+    for _ in range(3):
+        with mock.patch('yamllint.parser.token_or_comment_generator',
+                        return_value=iter(elems)):
+            start = time.perf_counter()
+            list(linter.get_token_and_comment_events(source, conf, [rule],
+                                                     []))
+            durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(size=10_000):
+    for rule_id, build_source in SOURCES.items():
+        small = duration(rule_id, build_source(size))
+        big = duration(rule_id, build_source(4 * size))
+        print(f'{rule_id}: {small:.3f}s, then {big:.3f}s on a source 4 times '
+              f'bigger ({big / small:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
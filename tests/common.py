@@ -20,10 +20,12 @@ import shutil
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 import yaml
 
-from yamllint import linter
+from yamllint import linter, parser
+import yamllint.rules
 from yamllint.config import YamlLintConfig
 
 
@@ -55,6 +57,70 @@ class RuleTestCase(unittest.TestCase):
         real_problems = list(linter.run(source, self.build_fake_config(conf)))
         self.assertEqual(real_problems, expected_problems)
 
+    def assert_linear_work(self, build_source, size=250):
+        """Checks that the work done by the rule grows linearly with the
+        source size.
+
+        The work is the number of lines of the rule's module and of the parser
+        (which keeps the context shared by rules) that run while linting, plus
+        the number of comparisons made between scalar values, which looking
+        them up in a list doesn't show as lines. Tokens are scanned
+        beforehand. On a source 4 times bigger, a linear rule does about 4
+        times more work, a quadratic one about 16 times more."""
+        conf = YamlLintConfig(f'rules: {{{self.rule_id}: enable}}')
+        rule = yamllint.rules.get(self.rule_id)
+        traced = {rule.__file__, parser.__file__}
+
+        def work(size):
+            source = build_source(size)
+            elems = list(parser.token_or_comment_generator(source))
+            for elem in elems:
+                if isinstance(elem, parser.Token) and isinstance(
+                        elem.curr, yaml.ScalarToken):
+                    elem.curr.value = CountedStr(elem.curr.value)
+            lines = 0
+
+            def trace_lines(frame, event, arg):
+                nonlocal lines
+                if event == 'line':
+                    lines += 1
+                return trace_lines
+
+            def trace_calls(frame, event, arg):
+                if frame.f_code.co_filename in traced:
+                    return trace_lines
+
+            CountedStr.comparisons = 0
+            with mock.patch('yamllint.parser.token_or_comment_generator',
+                            return_value=iter(elems)):
+                tracer = sys.gettrace()
+                sys.settrace(trace_calls)
+                try:
+                    list(linter.get_token_and_comment_events(
+                        source, conf, [rule], []))
+                finally:
+                    sys.settrace(tracer)
+            return lines + CountedStr.comparisons
+
+        work_done = work(size)
+        self.assertGreater(work_done, 0)
+        self.assertLess(work(4 * size), 5 * work_done)
+
+
+class CountedStr(str):
+    """String counting the comparisons made with it."""
+    comparisons = 0
+
+    def __eq__(self, other):
+        CountedStr.comparisons += 1
+        return str.__eq__(self, other)
+
+    def __lt__(self, other):
+        CountedStr.comparisons += 1
+        return str.__lt__(self, other)
+
+    __hash__ = str.__hash__
+
 
 class RunContext:
     """Context manager for ``cli.run()`` to capture exit code and streams."""
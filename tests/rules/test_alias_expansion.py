@@ -0,0 +1,157 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from tests.common import RuleTestCase
+
+from yamllint import config
+
+
+class AliasExpansionTestCase(RuleTestCase):
+    rule_id = 'alias-expansion'
+
+    def test_disabled(self):
+        conf = 'alias-expansion: disable'
+        self.check('---\n'
+                   'a: &a [x, x, x, x, x, x, x, x, x, x]\n'
+                   'b: &b [*a, *a, *a, *a, *a, *a, *a, *a, *a, *a]\n'
+                   'c: &c [*b, *b, *b, *b, *b, *b, *b, *b, *b, *b]\n'
+                   'd: &d [*c, *c, *c, *c, *c, *c, *c, *c, *c, *c]\n'
+                   'e: &e [*d, *d, *d, *d, *d, *d, *d, *d, *d, *d]\n'
+                   'f: [*e, *e, *e, *e, *e, *e, *e, *e, *e, *e]\n'
+                   'g: &g [x, *g]\n', conf)
+
+    def test_invalid_options(self):
+        self.check('---\n'
+                   'base: &base {a: 1}\n'
+                   'child:\n'
+                   '  <<: *base\n', 'alias-expansion: {max-merge-depth: 0}',
+                   problem=(4, 7))
+        for option in ('max-expanded-nodes', 'max-merge-depth'):
+            with self.assertRaisesRegex(
+                    config.YamlLintConfigError,
+                    f'"{option}" should be a non-negative number'):
+                self.check('', f'alias-expansion: {{{option}: -1}}')
+
+    def test_billion_laughs(self):
+        conf = 'alias-expansion: enable'
+        self.check('---\n'
+                   'a: &a [x, x, x, x, x, x, x, x, x, x]\n'
+                   'b: &b [*a, *a, *a, *a, *a, *a, *a, *a, *a, *a]\n'
+                   'c: &c [*b, *b, *b, *b, *b, *b, *b, *b, *b, *b]\n'
+                   'd: &d [*c, *c, *c, *c, *c, *c, *c, *c, *c, *c]\n',
+                   conf)
+        self.check('---\n'
+                   'a: &a [x, x, x, x, x, x, x, x, x, x]\n'
+                   'b: &b [*a, *a, *a, *a, *a, *a, *a, *a, *a, *a]\n'
+                   'c: &c [*b, *b, *b, *b, *b, *b, *b, *b, *b, *b]\n'
+                   'd: &d [*c, *c, *c, *c, *c, *c, *c, *c, *c, *c]\n'
+                   'e: &e [*d, *d, *d, *d, *d, *d, *d, *d, *d, *d]\n'
+                   'f: [*e, *e, *e, *e, *e, *e, *e, *e, *e, *e]\n',
+                   conf, problem=(6, 36))
+
+    def test_max_expanded_nodes(self):
+        conf = 'alias-expansion: {max-expanded-nodes: 20}'
+        self.check('---\n'
+                   '- &a [x, x, x]\n'
+                   '- [*a, *a, *a]\n', conf)
+        self.check('---\n'
+                   '- &a [x, x, x]\n'
+                   '- &b [*a, *a, *a]\n'
+                   '- [*b, *b, *b]\n', conf, problem=(4, 4))
+        conf = ('alias-expansion: {max-expanded-nodes: 25}\n'
+                'indentation: {indent-sequences: whatever}\n')
+        self.check('---\n'
+                   'a: &a\n'
+                   '  b: &b\n'
+                   '  - x\n'
+                   '  - y\n'
+                   '  c: &c\n'
+                   '  d: &d !!str z\n'
+                   'e: [*a, *b, *c, *d, *d]\n', conf)
+        self.check('---\n'
+                   'a: &a\n'
+                   '  b: &b\n'
+                   '  - x\n'
+                   '  - y\n'
+                   '  c: &c\n'
+                   '  d: &d !!str z\n'
+                   'e: [*a, *b, *c, *d, *d, *d]\n', conf, problem=(8, 25))
+        # Anchors and node counts are reset in each document
+        conf = 'alias-expansion: {max-expanded-nodes: 20}'
+        self.check('---\n'
+                   '- &a [x, x, x]\n'
+                   '- [*a, *a, *a]\n'
+                   '---\n'
+                   '- &a [x, x, x]\n'
+                   '- [*a, *a, *a]\n'
+                   '...\n'
+                   '---\n'
+                   '- &a [x, x, x]\n'
+                   '- [*a, *a, *a]\n', conf)
+
+    def test_recursive_aliases(self):
+        conf = 'alias-expansion: enable'
+        self.check('---\n'
+                   '&a [x, *a]\n', conf, problem=(2, 8))
+        self.check('---\n'
+                   'a: &a\n'
+                   '  b:\n'
+                   '    - *a\n'
+                   'c: *a\n', conf, problem=(4, 7))
+        self.check('---\n'
+                   'a: &a\n'
+                   '  - x\n'
+                   '  - *a\n'
+                   'b: *a\n', conf, problem=(4, 5))
+
+    def test_max_merge_depth(self):
+        conf = 'alias-expansion: {max-merge-depth: 1}'
+        self.check('---\n'
+                   'base: &base\n'
+                   '  foo: bar\n'
+                   'child:\n'
+                   '  <<: *base\n'
+                   '  extra: value\n', conf)
+        self.check('---\n'
+                   'base: &base\n'
+                   '  foo: bar\n'
+                   'child: &child\n'
+                   '  <<: *base\n'
+                   '  extra: value\n'
+                   'grandchild:\n'
+                   '  <<: *child\n', conf, problem=(8, 7))
+        self.check('---\n'
+                   'base: &base\n'
+                   '  foo: bar\n'
+                   'other: &other {x: y}\n'
+                   'child: &child\n'
+                   '  nested:\n'
+                   '    <<: [*other, *base]\n'
+                   'grandchild:\n'
+                   '  <<: [*other, *child]\n'
+                   '  key: *child\n', conf, problem=(9, 16))
+        self.check('---\n'
+                   'base: &base\n'
+                   '  foo: bar\n'
+                   'child: &child\n'
+                   '  "<<": *base\n'
+                   '  list: [*base]\n'
+                   'grandchild:\n'
+                   '  <<: *child\n', conf)
+
+    def test_many_aliases(self):
+        self.assert_linear_work(
+            lambda n: '---\n- &a0 x\n' + ''.join(
+                f'- &a{i} [*a{i - 1}, *a{i - 1}]\n' for i in range(1, n)))
@@ -17,7 +17,13 @@ import unittest
 
 import yaml
 
-from yamllint.rules.common import get_line_indent
+from yamllint.parser import Structure
+from yamllint.rules.common import (
+    get_line_indent,
+    quotes_are_needed,
+    scalar_info,
+    spacing,
+)
 
 
 class CommonTestCase(unittest.TestCase):
@@ -41,3 +47,74 @@ class CommonTestCase(unittest.TestCase):
             self.assertEqual(get_line_indent(tokens[i]), 0)
         for i in (13, 16, 18, 22, 24):
             self.assertEqual(get_line_indent(tokens[i]), 2)
+
+    def test_scalar_info(self):
+        tokens = [t for t in yaml.scan('- yes\n'
+                                       '- .5e3\n'
+                                       '- .NaN\n'
+                                       '- -.inf\n'
+                                       '- 010\n'
+                                       '- 0o10\n'
+                                       '- "a, b"\n')
+                  if isinstance(t, yaml.ScalarToken)]
+
+        # Rules inspecting the current token share its ScalarInfo
+        structure = Structure()
+        context = {'structure': structure}
+        structure.update(tokens[0], tokens[1])
+        info = scalar_info(tokens[0], context)
+        self.assertIs(scalar_info(tokens[0], {'structure': structure}), info)
+        self.assertIsNot(scalar_info(tokens[0]), info)
+        self.assertEqual(info.implicit_tag, 'tag:yaml.org,2002:bool')
+        self.assertFalse(info.is_implicit_octal)
+
+        structure.update(tokens[1], tokens[2])
+        self.assertEqual(structure.facts, {})
+        info = scalar_info(tokens[1], context)
+        self.assertIsNot(scalar_info(tokens[0], context), info)
+        self.assertTrue(info.is_scientific_notation)
+        self.assertTrue(info.lacks_numeral_before_decimal)
+
+        self.assertTrue(scalar_info(tokens[2]).is_nan)
+        self.assertFalse(scalar_info(tokens[2]).is_inf)
+        self.assertTrue(scalar_info(tokens[3]).is_inf)
+        self.assertTrue(scalar_info(tokens[4]).is_implicit_octal)
+        self.assertFalse(scalar_info(tokens[4]).is_explicit_octal)
+        self.assertTrue(scalar_info(tokens[5]).is_explicit_octal)
+
+        info = scalar_info(tokens[6])
+        self.assertEqual(info.implicit_tag, 'tag:yaml.org,2002:str')
+        self.assertFalse(info.quotes_are_needed(False))
+        self.assertTrue(info.quotes_are_needed(True))
+
+    def test_quotes_are_needed(self):
+        for string in ('plain', 'hello world', 'a.b-c_d', 'x=1', "it's"):
+            self.assertFalse(quotes_are_needed(string, '"', False))
+        for string in ('', 'a: b', '- x', '#c', 'x #c', 'a ', '*ref',
+                       '{x}', 'tab\there'):
+            self.assertTrue(quotes_are_needed(string, '"', False))
+        self.assertFalse(quotes_are_needed('a, b', '"', False))
+        self.assertTrue(quotes_are_needed('a, b', '"', True))
+
+    def test_spacing(self):
+        tokens = list(yaml.scan('a:   [b ,c]\n'
+                                'd:\n'
+                                '  e\n'))
+
+        structure = Structure()
+        context = {'structure': structure}
+        structure.update(tokens[4], tokens[5])
+        facts = spacing(tokens[4], tokens[3], tokens[5], context)
+        self.assertIs(spacing(tokens[4], tokens[3], tokens[5], context), facts)
+        self.assertIsNot(spacing(tokens[4], tokens[3], tokens[5]), facts)
+        self.assertEqual((facts.before, facts.after), (0, 3))
+        structure.update(tokens[5], tokens[6])
+        self.assertIsNot(spacing(tokens[4], tokens[3], tokens[5], context),
+                         facts)
+
+        facts = spacing(tokens[7], tokens[6], tokens[8])
+        self.assertEqual((facts.before, facts.after), (1, 0))
+
+        facts = spacing(tokens[12], tokens[11], tokens[13])
+        self.assertIsInstance(tokens[12], yaml.ValueToken)
+        self.assertEqual((facts.before, facts.after), (0, None))
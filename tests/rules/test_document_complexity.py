@@ -0,0 +1,119 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from tests.common import RuleTestCase
+
+from yamllint import config
+
+
+class DocumentComplexityTestCase(RuleTestCase):
+    rule_id = 'document-complexity'
+
+    def test_disabled(self):
+        conf = 'document-complexity: disable'
+        self.check('---\n' + 30 * '[' + 30 * ']' + '\n', conf)
+        self.check('---\n[\n' + 2000 * '  0,\n' + ']\n', conf)
+
+    def test_invalid_options(self):
+        for option in ('max-depth', 'max-nodes', 'max-keys',
+                       'max-flow-items'):
+            with self.assertRaisesRegex(
+                    config.YamlLintConfigError,
+                    f'"{option}" should be a non-negative number'):
+                self.check('', f'document-complexity: {{{option}: -1}}')
+
+    def test_max_depth(self):
+        conf = 'document-complexity: {max-depth: 2}'
+        self.check('---\n'
+                   'key:\n'
+                   '  - item\n'
+                   'other:\n'
+                   '  - {a: b}\n', conf, problem=(5, 5))
+        self.check('---\n'
+                   '- [[a], [b]]\n'
+                   '- [c]\n'
+                   '- key:\n'
+                   '    - d\n', conf,
+                   problem1=(2, 4), problem2=(2, 9), problem3=(5, 5))
+        # Indentless sequences are not counted
+        self.check('---\n'
+                   'a:\n'
+                   '- b: c\n',
+                   conf + '\nindentation: {indent-sequences: false}')
+        self.check('---\n' + 30 * '[' + 30 * ']' + '\n',
+                   'document-complexity: enable', problem=(2, 21))
+
+    def test_max_nodes(self):
+        conf = 'document-complexity: {max-nodes: 7}'
+        self.check('---\n'
+                   'a: 1\n'
+                   'b: [2, 3]\n', conf)
+        self.check('---\n'
+                   'a: 1\n'
+                   'b: [2, 3, 4]\n', conf, problem=(3, 11))
+        self.check('---\n'
+                   'a: &x 1\n'
+                   'b: [2, *x, 4]\n', conf, problem=(3, 12))
+        self.check('---\n'
+                   'a: 1\n'
+                   'b: [2, 3]\n'
+                   '---\n'
+                   'a: 1\n'
+                   'b: [2, 3]\n'
+                   '...\n'
+                   '---\n'
+                   'a: 1\n'
+                   'b: [2, 3]\n', conf)
+
+    def test_max_keys(self):
+        conf = 'document-complexity: {max-keys: 2}'
+        self.check('---\n'
+                   'a: 1\n'
+                   'b: {c: 2, d: 3}\n'
+                   'e:\n'
+                   '  ? f\n'
+                   '  : 4\n'
+                   '  g: 5\n', conf, problem=(4, 1))
+        self.check('---\n'
+                   '- a: 1\n'
+                   '  b: {c: 2, d: 3, e: 4, f: 5}\n'
+                   '- [g: 6, h: 7, i: 8]\n', conf, problem=(3, 19))
+
+    def test_max_flow_items(self):
+        conf = 'document-complexity: {max-flow-items: 3}'
+        self.check('---\n'
+                   '- [1, 2, 3]\n'
+                   '- 4\n'
+                   '- 5\n'
+                   '- 6\n'
+                   '- [[1, 2, 3], {a: 1, b: [2], c: 3}, &x !!str 4]\n'
+                   '- [1, 2, 3,\n'
+                   ']\n'
+                   '- []\n', conf)
+        self.check('---\n'
+                   '[1, 2, 3, 4]\n', conf, problem=(2, 11))
+        self.check('---\n'
+                   '{a: 1, b: 2, c: 3,\n'
+                   ' d: 4, e: 5}\n', conf, problem=(3, 2))
+        self.check('---\n'
+                   '- [[1, 2], [3], [4], [5, 6, 7, 8]]\n', conf,
+                   problem1=(2, 22), problem2=(2, 32))
+        self.check('---\n[\n' + 2000 * '  0,\n' + ']\n',
+                   'document-complexity: enable', problem=(1003, 3))
+
+    def test_many_items(self):
+        self.assert_linear_work(
+            lambda n: '---\n[' + ', '.join(f'{{a: [{i}]}}' for i in range(n))
+            + ']\n')
@@ -2006,6 +2006,24 @@ class ScalarIndentationTestCase(RuleTestCase):
                    '    {% endif %}\n', conf,
                    problem1=(3, 7), problem2=(5, 7))
 
+    def test_check_multi_line_long_literal_style(self):
+        conf = ('indentation: {spaces: consistent,\n'
+                '              check-multi-line-strings: true}\n'
+                'document-start: disable\n')
+        lines = ['    ' + 'QUJD' * 16 + '\n'] * 1000
+        lines[200] = '\n'
+        lines[500] = '     QUJD\n'
+        lines[600] = '      QUJD\n'
+        lines[999] = '     QUJD\n'
+        self.check('key:\n'
+                   '  cert: |\n' + ''.join(lines) +
+                   'other: value\n', conf,
+                   problem1=(503, 6), problem2=(603, 7), problem3=(1002, 6))
+        self.check('key:\n'
+                   '  cert: |\n' + ''.join(lines[:999]) +
+                   'other: value\n', conf,
+                   problem1=(503, 6), problem2=(603, 7))
+
     # The following "paragraph" examples are inspired from
     # http://stackoverflow.com/questions/3790454/in-yaml-how-do-i-break-a-string-over-multiple-lines
 
@@ -233,3 +233,7 @@ class KeyDuplicatesTestCase(RuleTestCase):
                    'No Merge Keys:\n'
                    '  key: a\n'
                    '  otherkey: b\n', conf)
+
+    def test_many_keys(self):
+        self.assert_linear_work(lambda n: ''.join(f'key{i}: {i}\n'
+                                                  for i in range(n)))
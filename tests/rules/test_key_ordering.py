@@ -169,3 +169,7 @@ class KeyOrderingTestCase(RuleTestCase):
                    conf,
                    problem1=(12, 1),
                    problem2=(13, 1))
+
+    def test_many_keys(self):
+        self.assert_linear_work(lambda n: ''.join(f'key{i:06}: {i}\n'
+                                                  for i in range(n)))
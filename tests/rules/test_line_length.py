@@ -176,6 +176,60 @@ class LineLengthTestCase(RuleTestCase):
                    '  {% this line is' + 99 * ' really' + ' long %}\n',
                    conf, problem=(3, 81))
 
+        # Lines of block scalars are not mappings, even if they look like it
+        url = 'http://localhost/' + 20 * 'very/' + 'long/url'
+        self.check('---\n'
+                   'content: |\n'
+                   '  url: ' + url + '\n',
+                   conf, problem=(3, 81))
+        self.check('---\n'
+                   'url: ' + url + '\n'
+                   'content: |\n'
+                   '  text\n',
+                   conf)
+
+        # Neither are continuation lines of multi-line scalars
+        self.check('---\n'
+                   'content: "first line\n'
+                   '  url: ' + url + '"\n',
+                   conf, problem=(3, 81))
+        self.check("---\n"
+                   "content: 'first line\n"
+                   "  url: " + url + "'\n",
+                   conf, problem=(3, 81))
+        self.check('---\n'
+                   'content: first line\n'
+                   '  and ' + url + '\n',
+                   conf, problem=(3, 81))
+        self.check('---\n'
+                   'content: first line\n'
+                   '  url:' + url + '\n',
+                   conf)
+
+        # Continuation lines of flow collections can start with other entries
+        flow_conf = (conf + '\n'
+                     'commas: disable\n'
+                     'indentation: disable\n')
+        self.check('---\n'
+                   'a: {b: 1,\n'
+                   '   c: ' + url + '\n'
+                   '   , d: ' + url + '}\n'
+                   'e: [\n'
+                   '  elem,  key: ' + url + ',\n'
+                   '  {f: ' + url + '},\n'
+                   ']\n',
+                   flow_conf)
+        self.check('---\n'
+                   'a: {b: 1\n'
+                   '   , d: ' + url + ' + word}\n',
+                   flow_conf, problem=(3, 81))
+
+        # After a syntax error, lines are checked on their own
+        self.check('---\n'
+                   '- url: ' + url + '\n'
+                   '   date: 1969\n',
+                   conf, problem=(3, 8, 'syntax'))
+
     def test_unicode(self):
         conf = 'line-length: {max: 53}'
         self.check('---\n'
@@ -0,0 +1,90 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from tests.common import RuleTestCase
+
+from yamllint import config
+
+
+class ScalarSizeTestCase(RuleTestCase):
+    rule_id = 'scalar-size'
+
+    def test_disabled(self):
+        conf = ('scalar-size: disable\n'
+                'line-length: disable\n')
+        self.check('---\n'
+                   'key: ' + 100000 * 'x' + '\n', conf)
+
+    def test_invalid_options(self):
+        for option in ('max-bytes', 'max-lines'):
+            with self.assertRaisesRegex(
+                    config.YamlLintConfigError,
+                    f'"{option}" should be a non-negative number or false'):
+                self.check('', f'scalar-size: {{{option}: -1}}')
+
+    def test_max_bytes(self):
+        conf = ('scalar-size: {max-bytes: 10, max-lines: false}\n'
+                'document-start: disable\n')
+        self.check('key: short\n', conf)
+        self.check('key: a much longer value\n', conf, problem=(1, 6))
+        self.check('a much longer key: value\n', conf, problem=(1, 1))
+        # 9 characters, 18 bytes
+        self.check('key: ééééééééé\n', conf, problem=(1, 6))
+        self.check('key: éééé\n', conf)
+        self.check('key: "\\u00e9\\u00e9\\u00e9\\u00e9\\u00e9\\u00e9"\n',
+                   conf, problem=(1, 6))
+        self.check('key: |\n'
+                   '  0123\n'
+                   '  5678\n', conf)
+        self.check('key: |\n'
+                   '  01234\n'
+                   '  56789\n', conf, problem=(1, 6))
+        self.check('- ' + 100 * 'x' + '\n' +
+                   '- ' + 10 * 'x' + '\n' +
+                   '- ' + 11 * 'x' + '\n', conf,
+                   problem1=(1, 3), problem2=(3, 3))
+
+    def test_max_lines(self):
+        conf = ('scalar-size: {max-bytes: false, max-lines: 3}\n'
+                'document-start: disable\n')
+        self.check('key: |\n'
+                   '  line 1\n'
+                   '  line 2\n', conf)
+        self.check('key: |\n'
+                   '  line 1\n'
+                   '  line 2', conf + 'new-line-at-end-of-file: disable\n')
+        self.check('key: |\n'
+                   '  line 1\n'
+                   '  line 2\n'
+                   '  line 3\n', conf, problem=(1, 6))
+        self.check('key: "line 1\n'
+                   '  line 2\n'
+                   '  line 3"\n'
+                   'other: plain\n'
+                   '  multi-line\n'
+                   '  scalar\n'
+                   '  here\n', conf, problem=(4, 8))
+
+    def test_defaults(self):
+        conf = ('scalar-size: enable\n'
+                'line-length: disable\n')
+        self.check('---\n'
+                   'key: ' + 65536 * 'x' + '\n', conf)
+        self.check('---\n'
+                   'key: ' + 65537 * 'x' + '\n', conf, problem=(2, 6))
+        self.check('---\n'
+                   'key: |\n' + 999 * '  x\n', conf)
+        self.check('---\n'
+                   'key: |\n' + 1000 * '  x\n', conf, problem=(2, 6))
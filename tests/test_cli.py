@@ -17,14 +17,17 @@ import locale
 import os
 import pty
 import shutil
+import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from io import StringIO
+from unittest import mock
 
 from tests.common import build_temp_workspace, RunContext, temp_workspace
 
-from yamllint import cli, config
+from yamllint import cli, config, linter
 
 
 # Check system's UTF-8 availability
@@ -38,6 +41,14 @@ def utf8_available():
         return True
 
 
+def slow_check_file_syntax(file):
+    # Module-level, so that worker processes can unpickle it
+    if file == 'slow.yaml':
+        time.sleep(60)
+    with open(file, newline='') as f:
+        return linter.check_syntax(f)
+
+
 def setUpModule():
     # yamllint uses these environment variables to find a config file.
     env_vars_that_could_interfere = (
@@ -652,6 +663,42 @@ class CommandLineTestCase(unittest.TestCase):
             cli.run((path, '--no-warnings', '-f', 'auto'))
         self.assertEqual(ctx.returncode, 0)
 
+    def test_run_no_warnings_skips_warning_rules(self):
+        path = os.path.join(self.wd, 'warn.yaml')
+
+        with mock.patch('yamllint.rules.document_start.check') as check:
+            with RunContext(self) as ctx:
+                cli.run((path, '--no-warnings'))
+        self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr), (0, '', ''))
+        check.assert_not_called()
+
+        # With --strict, warnings change the return code
+        with RunContext(self) as ctx:
+            cli.run((path, '--no-warnings', '--strict'))
+        self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr), (2, '', ''))
+
+    def test_run_select_and_ignore_rules(self):
+        path = os.path.join(self.wd, 'en.yaml')
+
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', '--select', 'key-ordering, truthy',
+                     path))
+        self.assertEqual((ctx.returncode, ctx.stderr), (1, ''))
+        self.assertEqual(ctx.stdout, (
+            f'{path}:3:1: [error] wrong ordering of key "A" in mapping '
+            f'(key-ordering)\n'))
+
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', '--ignore-rules',
+                     'new-line-at-end-of-file,truthy', path))
+        self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr), (0, '', ''))
+
+        with RunContext(self) as ctx:
+            cli.run(('--select', 'colons,unknown', path))
+        self.assertEqual((ctx.returncode, ctx.stdout), (-1, ''))
+        self.assertEqual(ctx.stderr,
+                         'invalid config: no such rule: "unknown"\n')
+
     def test_run_no_warnings_and_strict(self):
         path = os.path.join(self.wd, 'warn.yaml')
 
@@ -659,6 +706,175 @@ class CommandLineTestCase(unittest.TestCase):
             cli.run((path, '--no-warnings', '-s'))
         self.assertEqual(ctx.returncode, 2)
 
+    def test_run_stats(self):
+        # empty.yml and sub/directory.yaml/empty.yml have identical contents
+        with RunContext(self) as ctx:
+            cli.run(('--stats', os.path.join(self.wd, 'empty.yml'),
+                     os.path.join(self.wd, 'sub')))
+        self.assertEqual(ctx.returncode, 0)
+        self.assertEqual(ctx.stderr,
+                         '3 files checked, 1 lints saved on duplicate '
+                         'contents\n')
+
+    def test_run_max_file_size(self):
+        path = os.path.join(self.wd, 'a.yaml')
+
+        with RunContext(self) as ctx:
+            cli.run(('-d', 'extends: default\nmax-file-size: 13', path))
+        expected_out = (
+            f'{path}\n'
+            f'  1:1       error    file too big: 14 > 13 bytes '
+            f'(max-file-size)\n'
+            f'\n')
+        self.assertEqual(
+            (ctx.returncode, ctx.stdout, ctx.stderr), (1, expected_out, ''))
+
+        with RunContext(self) as ctx:
+            cli.run(('-d', 'extends: default\nmax-file-size: 14\n'
+                           'rules: {trailing-spaces: disable,'
+                           ' new-line-at-end-of-file: disable}', path))
+        self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr), (0, '', ''))
+
+        with RunContext(self) as ctx:
+            cli.run(('-d', 'extends: default\nmax-file-size: 13\n'
+                           'ignore: a.yaml', path))
+        self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr), (0, '', ''))
+
+    def test_run_syntax_only(self):
+        with temp_workspace({'ok.yaml': 'key:   value \n',
+                             'bad.yaml': '- a\nb: c\n',
+                             'ignored/bad.yaml': '- a\nb: c\n',
+                             'big.yaml': 'key: [' + 1000 * 'value, ' + ']\n',
+                             }):
+            with RunContext(self) as ctx:
+                cli.run(('-d', 'extends: default\n'
+                               'max-file-size: 1000\n'
+                               'ignore: ignored/',
+                         '--syntax-only', '-f', 'parsable', '.'))
+            self.assertEqual(ctx.returncode, 1)
+            self.assertEqual(ctx.stderr, '')
+            self.assertEqual(
+                sorted(line.split(' [error] ')[0]
+                       for line in ctx.stdout.splitlines()),
+                ['./bad.yaml:2:1:', './big.yaml:1:1:'])
+
+            # Same results when the checks are run by worker processes
+            with mock.patch('yamllint.cli.SYNTAX_CHECK_POOL_MIN_FILES', 1):
+                with RunContext(self) as pooled_ctx:
+                    cli.run(('-d', 'extends: default\n'
+                                   'max-file-size: 1000\n'
+                                   'ignore: ignored/',
+                             '--syntax-only', '-f', 'parsable', '.'))
+            self.assertEqual(
+                (pooled_ctx.returncode, pooled_ctx.stdout, pooled_ctx.stderr),
+                (ctx.returncode, ctx.stdout, ctx.stderr))
+
+            for min_files in (1, 100):
+                with mock.patch('yamllint.cli.SYNTAX_CHECK_POOL_MIN_FILES',
+                                min_files):
+                    with RunContext(self) as ctx:
+                        cli.run(('--syntax-only', 'ok.yaml', 'missing.yaml'))
+                self.assertEqual(ctx.returncode, -1)
+                self.assertEqual(ctx.stdout, '')
+                self.assertRegex(ctx.stderr, 'No such file or directory')
+
+            self.addCleanup(setattr, sys, 'stdin', sys.__stdin__)
+            sys.stdin = StringIO('- a\nb: c\n')
+            with RunContext(self) as ctx:
+                cli.run(('--syntax-only', '-f', 'parsable', '-'))
+            self.assertEqual(ctx.returncode, 1)
+            self.assertRegex(ctx.stdout,
+                             r'^stdin:2:1: \[error\] syntax error: ')
+
+    def test_run_fail_fast(self):
+        for args in ((), ('--syntax-only',)):
+            with temp_workspace({'a.yaml': '---\n'
+                                           'key: value\n',
+                                 'b.yaml': 'key: value\n'
+                                           '- a\n'
+                                           'b: c\n',
+                                 'c.yaml': '- a\nb: c\n'}):
+                with RunContext(self) as ctx:
+                    cli.run(('-f', 'parsable', '--fail-fast',
+                             'a.yaml', 'b.yaml', 'c.yaml') + args)
+                self.assertEqual(ctx.returncode, 1)
+                self.assertEqual(ctx.stderr, '')
+                lines = ctx.stdout.splitlines()
+                self.assertEqual(lines[-1][:9], 'b.yaml:2:')
+                self.assertEqual([line for line in lines if '[error]' in line],
+                                 lines[-1:])
+
+                # c.yaml is not counted, even if a worker already checked it
+                with mock.patch('yamllint.cli.SYNTAX_CHECK_POOL_MIN_FILES',
+                                1):
+                    with RunContext(self) as ctx:
+                        cli.run(('--stats', '--fail-fast',
+                                 'a.yaml', 'b.yaml', 'c.yaml') + args)
+                self.assertEqual(ctx.returncode, 1)
+                self.assertEqual(ctx.stderr,
+                                 '2 files checked, 0 lints saved on duplicate '
+                                 'contents\n')
+
+        path = os.path.join(self.wd, 'warn.yaml')
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', '--fail-fast', path, path))
+        self.assertEqual(ctx.returncode, 0)
+        self.assertEqual(len(ctx.stdout.splitlines()), 2)
+
+    def test_run_fail_fast_interrupts_syntax_checks(self):
+        # A check still running in a worker doesn't delay the exit
+        with temp_workspace({'bad.yaml': '- a\nb: c\n',
+                             'slow.yaml': 'key: value\n'}):
+            with mock.patch('yamllint.cli.SYNTAX_CHECK_POOL_MIN_FILES', 1), \
+                    mock.patch('yamllint.cli.check_file_syntax',
+                               slow_check_file_syntax):
+                start = time.monotonic()
+                with RunContext(self) as ctx:
+                    cli.run(('-f', 'parsable', '--syntax-only',
+                             '--fail-fast', 'bad.yaml', 'slow.yaml'))
+                elapsed = time.monotonic() - start
+        self.assertEqual(ctx.returncode, 1)
+        self.assertTrue(ctx.stdout.startswith('bad.yaml:2:1: [error] '))
+        self.assertLess(elapsed, 30)
+
+    def test_run_max_problems_per_file(self):
+        path = os.path.join(self.wd, 'a.yaml')
+
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', '--max-problems-per-file', '1', path))
+        self.assertEqual(ctx.returncode, 1)
+        self.assertEqual(ctx.stdout, (
+            f'{path}:2:4: [error] trailing spaces (trailing-spaces)\n'
+            f'{path}:3:4: [error] more problems not reported '
+            f'(max-problems-per-file: 1)\n'))
+
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', '--max-problems-per-file', '0', path))
+        self.assertEqual(ctx.returncode, 1)
+        self.assertEqual(ctx.stdout, (
+            f'{path}:2:4: [error] more problems not reported '
+            f'(max-problems-per-file: 0)\n'))
+
+        # Warnings hiding errors and syntax errors don't change the return code
+        path = os.path.join(self.wd, 'broken.yaml')
+        with open(path, 'w') as f:
+            f.write('a: yes\nb: yes\nc: [\n')
+        self.addCleanup(os.remove, path)
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', path))
+        self.assertEqual(ctx.returncode, 1)
+        with RunContext(self) as ctx:
+            cli.run(('-f', 'parsable', '--max-problems-per-file', '1', path))
+        self.assertEqual(ctx.returncode, 1)
+        lines = ctx.stdout.splitlines()
+        self.assertEqual(lines[0], f'{path}:1:1: [warning] missing document '
+                                   f'start "---" (document-start)')
+        self.assertEqual(lines[1], f'{path}:1:4: [error] more problems not '
+                                   f'reported (max-problems-per-file: 1)')
+        self.assertTrue(lines[2].startswith(f'{path}:4:1: [error] syntax '
+                                            f'error: '))
+        self.assertEqual(len(lines), 3)
+
     def test_run_non_universal_newline(self):
         path = os.path.join(self.wd, 'dos.yml')
 
@@ -730,6 +946,117 @@ class CommandLineTestCase(unittest.TestCase):
             [os.path.join(self.wd, 'a.yaml')]
         )
 
+    def test_find_files_recursively_prunes_ignored_dirs(self):
+        walked = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            walked.append(path)
+            return real_scandir(path)
+
+        conf = config.YamlLintConfig('extends: default\n'
+                                     'ignore: |\n'
+                                     '  /s/s/s/\n'
+                                     '  sub/\n')
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.wd)
+        with mock.patch('os.scandir', scandir):
+            files = sorted(cli.find_files_recursively(['.'], conf))
+        self.assertEqual(
+            files,
+            ['./a.yaml', './c.yaml', './dos.yml', './empty.yml', './en.yaml',
+             './symlinks/link.yaml', './warn.yaml']
+        )
+        self.assertIn('./s/s', walked)
+        self.assertNotIn('./s/s/s', walked)
+        self.assertNotIn('./sub', walked)
+
+        # Negated patterns can re-include files from ignored directories
+        conf = config.YamlLintConfig('extends: default\n'
+                                     'ignore: |\n'
+                                     '  sub/\n'
+                                     '  !sub/ok.yaml\n')
+        self.assertIn('./sub/ok.yaml',
+                      list(cli.find_files_recursively(['.'], conf)))
+
+    def test_find_files_recursively_with_gitignore(self):
+        workspace = {
+            '.git/info/exclude': 'excluded.yaml\n',
+            '.git/config.yaml': '',
+            '.gitignore': 'build/\n*.gen.yaml\n',
+            'a.yaml': '',
+            'a.gen.yaml': '',
+            'excluded.yaml': '',
+            'build/b.yaml': '',
+            'sub/.gitignore': '!keep.gen.yaml\n/local.yaml\n',
+            'sub/c.yaml': '',
+            'sub/keep.gen.yaml': '',
+            'sub/other.gen.yaml': '',
+            'sub/local.yaml': '',
+            'sub/deep/local.yaml': '',
+            'sub/deep/build/d.yaml': '',
+        }
+        walked = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            walked.append(path)
+            return real_scandir(path)
+
+        with temp_workspace(workspace):
+            conf = config.YamlLintConfig('extends: default\n')
+            self.assertEqual(
+                len(list(cli.find_files_recursively(['.'], conf))), 11)
+
+            conf = config.YamlLintConfig('extends: default\n'
+                                         'respect-gitignore: true\n')
+            with mock.patch('os.scandir', scandir):
+                files = sorted(cli.find_files_recursively(['.'], conf))
+            self.assertEqual(
+                files,
+                ['./a.yaml', './sub/c.yaml', './sub/deep/local.yaml',
+                 './sub/keep.gen.yaml']
+            )
+            self.assertNotIn('./.git', walked)
+            self.assertNotIn('./build', walked)
+            self.assertNotIn('./sub/deep/build', walked)
+
+            # Ignore files from parent directories apply too
+            self.assertEqual(
+                sorted(cli.find_files_recursively(['sub'], conf)),
+                ['sub/c.yaml', 'sub/deep/local.yaml', 'sub/keep.gen.yaml']
+            )
+            self.assertEqual(
+                sorted(cli.find_files_recursively(['sub/deep'], conf)),
+                ['sub/deep/local.yaml']
+            )
+
+    def test_find_files_recursively_with_gitignore_in_git_file(self):
+        # In submodules and worktrees, .git is a file pointing to the actual
+        # git directory
+        workspace = {
+            'modules/sub/info/exclude': 'excluded.yaml\n',
+            'main/info/exclude': 'excluded-in-tree.yaml\n',
+            'main/worktrees/tree/commondir': '../..\n',
+            'sub/.git': 'gitdir: ../modules/sub\n',
+            'sub/.gitignore': 'ignored.yaml\n',
+            'sub/a.yaml': '',
+            'sub/excluded.yaml': '',
+            'sub/ignored.yaml': '',
+            'sub/dir/ignored.yaml': '',
+            'tree/.git': 'gitdir: ../main/worktrees/tree\n',
+            'tree/b.yaml': '',
+            'tree/excluded-in-tree.yaml': '',
+        }
+        with temp_workspace(workspace):
+            conf = config.YamlLintConfig('extends: default\n'
+                                         'respect-gitignore: true\n')
+            self.assertEqual(
+                sorted(cli.find_files_recursively(['sub', 'tree'], conf)),
+                ['sub/a.yaml', 'tree/b.yaml'])
+            self.assertEqual(
+                sorted(cli.find_files_recursively(['sub/dir'], conf)), [])
+
 
 class CommandLineConfigTestCase(unittest.TestCase):
     def test_config_file(self):
@@ -814,3 +1141,82 @@ class CommandLineConfigTestCase(unittest.TestCase):
         self.assertEqual((ctx.returncode, ctx.stdout, ctx.stderr),
                          (0, './4spaces.yml:2:5: [warning] wrong indentation: '
                          'expected 3 but found 4 (indentation)\n', ''))
+
+
+@unittest.skipIf(shutil.which('git') is None, 'git is not installed')
+class CommandLineGitTestCase(unittest.TestCase):
+    def git(self, *args):
+        subprocess.run(('git', '-c', 'user.name=yamllint',
+                        '-c', 'user.email=yamllint@example.com') + args,
+                       check=True, capture_output=True)
+
+    def test_git_files(self):
+        workspace = {
+            'a.yaml': '---\nkey: value\n',
+            'sub/b.yaml': '---\nkey: value\n',
+            'sub/ignored.yaml': '---\nkey: value\n',
+            'untracked.yaml': '---\nkey: value\n',
+            'not-yaml.txt': 'text\n',
+        }
+        with temp_workspace(workspace):
+            self.git('init', '-q')
+            self.git('add', 'a.yaml', 'sub', 'not-yaml.txt')
+            self.git('commit', '-q', '-m', 'init')
+
+            with RunContext(self) as ctx:
+                cli.run(('--list-files', '--git-files',
+                         '-d', '{ignore: ignored.yaml}', '.'))
+            self.assertEqual(ctx.returncode, 0, ctx.stderr)
+            self.assertEqual(sorted(ctx.stdout.splitlines()),
+                             ['./a.yaml', './sub/b.yaml'])
+
+            with RunContext(self) as ctx:
+                cli.run(('--list-files', '--git-files', 'sub',
+                         'untracked.yaml'))
+            self.assertEqual(ctx.returncode, 0, ctx.stderr)
+            self.assertEqual(sorted(ctx.stdout.splitlines()),
+                             ['sub/b.yaml', 'sub/ignored.yaml',
+                              'untracked.yaml'])
+
+    def test_changed_since(self):
+        workspace = {
+            'a.yaml': '---\nkey: value\n',
+            'sub/b.yaml': '---\nkey: value\n',
+            'sub/c.yaml': '---\nkey: value\n',
+        }
+        with temp_workspace(workspace):
+            self.git('init', '-q')
+            self.git('add', '.')
+            self.git('commit', '-q', '-m', 'init')
+            self.git('branch', 'base')
+            with open('sub/b.yaml', 'w') as f:
+                f.write('---\nkey:  value\n')
+            with open('sub/d.yaml', 'w') as f:
+                f.write('---\nkey: value\n')
+            self.git('add', 'sub/d.yaml')
+            self.git('commit', '-q', '-m', 'change')
+            os.remove('sub/c.yaml')
+
+            with RunContext(self) as ctx:
+                cli.run(('--list-files', '--changed-since', 'base', '.'))
+            self.assertEqual(ctx.returncode, 0, ctx.stderr)
+            self.assertEqual(sorted(ctx.stdout.splitlines()),
+                             ['./sub/b.yaml', './sub/d.yaml'])
+
+            with RunContext(self) as ctx:
+                cli.run(('--list-files', '--changed-since', 'base',
+                         'a.yaml', 'sub/b.yaml'))
+            self.assertEqual(ctx.returncode, 0, ctx.stderr)
+            self.assertEqual(ctx.stdout, 'sub/b.yaml\n')
+
+            with RunContext(self) as ctx:
+                cli.run(('-f', 'parsable', '--changed-since', 'base', '.'))
+            self.assertEqual(ctx.returncode, 1)
+            self.assertEqual(ctx.stdout, (
+                './sub/b.yaml:2:6: [error] too many spaces after colon '
+                '(colons)\n'))
+
+            with RunContext(self) as ctx:
+                cli.run(('--changed-since', 'unknown-ref', '.'))
+            self.assertEqual((ctx.returncode, ctx.stdout), (-1, ''))
+            self.assertNotEqual(ctx.stderr, '')
@@ -19,6 +19,7 @@ import sys
 import tempfile
 import unittest
 from io import StringIO
+from unittest import mock
 
 from tests.common import build_temp_workspace, RunContext
 
@@ -211,6 +212,110 @@ class SimpleConfigTestCase(unittest.TestCase):
                                   '  colons:\n'
                                   '    ignore: yes\n')
 
+    def test_rule_max_problems(self):
+        conf = config.YamlLintConfig('rules:\n'
+                                     '  colons:\n'
+                                     '    max-problems: 3\n')
+        self.assertEqual(conf.rules['colons']['max-problems'], 3)
+
+        # Only the "more problems not reported" problem is reported
+        conf = config.YamlLintConfig('rules:\n'
+                                     '  colons:\n'
+                                     '    max-problems: 0\n')
+        self.assertEqual(conf.rules['colons']['max-problems'], 0)
+
+        for value in ('-1', 'true', 'all'):
+            with self.assertRaisesRegex(
+                    config.YamlLintConfigError,
+                    'invalid config: max-problems should be a non-negative '
+                    'number'):
+                config.YamlLintConfig('rules:\n'
+                                      '  colons:\n'
+                                      f'    max-problems: {value}\n')
+
+    def test_select_rules(self):
+        conf = config.YamlLintConfig('extends: default\n'
+                                     'rules:\n'
+                                     '  colons: {max-spaces-before: 2}\n')
+        conf.select_rules(['colons', 'key-ordering', 'quoted-strings'])
+        self.assertEqual([r.ID for r in conf.enabled_rules(None)],
+                         ['colons', 'key-ordering', 'quoted-strings'])
+        self.assertEqual(conf.rules['colons']['max-spaces-before'], 2)
+        self.assertEqual(conf.rules['key-ordering']['level'], 'error')
+        self.assertIn('quoted-strings', conf.compiled)
+
+        conf = config.YamlLintConfig('extends: default\n')
+        conf.select_rules(ignore=['colons', 'comments'])
+        ids = [r.ID for r in conf.enabled_rules(None)]
+        self.assertIn('commas', ids)
+        self.assertNotIn('colons', ids)
+        self.assertNotIn('comments', ids)
+
+        conf.select_rules(['colons', 'commas'], ['colons'])
+        self.assertEqual([r.ID for r in conf.enabled_rules(None)],
+                         ['commas'])
+
+        with self.assertRaisesRegex(
+                config.YamlLintConfigError,
+                'invalid config: no such rule: "unknown"'):
+            conf.select_rules(ignore=['unknown'])
+
+    def test_prefilters(self):
+        conf = config.YamlLintConfig('rules:\n'
+                                     '  braces: enable\n'
+                                     '  brackets: disable\n'
+                                     '  colons: enable\n'
+                                     '  truthy:\n'
+                                     '    allowed-values: ["yes", "no"]\n')
+        self.assertEqual(sorted(conf.prefilters), ['braces', 'truthy'])
+        self.assertEqual([r.ID for r in conf.enabled_rules(None)],
+                         ['braces', 'colons', 'truthy'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, 'a: {b: yes}\n')],
+            ['braces', 'colons'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, 'a: [On, no]\n')],
+            ['colons', 'truthy'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, 'online: nope\n')],
+            ['colons'])
+
+        conf.select_rules(['brackets', 'colons', 'truthy'])
+        self.assertEqual(list(conf.prefilters), ['brackets', 'truthy'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, '[a, {b: yes}]\n')],
+            ['brackets', 'colons'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, 'a: 1\n')], ['colons'])
+
+        conf.select_rules(ignore=['brackets'])
+        self.assertEqual(list(conf.prefilters), ['truthy'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, '[a, {b: on}]\n')],
+            ['colons', 'truthy'])
+
+        conf = config.YamlLintConfig('rules:\n'
+                                     '  braces: {level: warning}\n'
+                                     '  truthy: enable\n')
+        conf.disable_warnings()
+        self.assertEqual(list(conf.prefilters), ['truthy'])
+        self.assertEqual(
+            [r.ID for r in conf.enabled_rules(None, '{a: on}\n')],
+            ['truthy'])
+
+    def test_disable_warnings(self):
+        conf = config.YamlLintConfig('extends: default\n'
+                                     'rules:\n'
+                                     '  colons: {level: warning}\n'
+                                     '  truthy: {level: error}\n')
+        conf.disable_warnings()
+        self.assertIs(conf.rules['colons'], False)
+        self.assertIs(conf.rules['comments'], False)
+        self.assertIs(conf.rules['document-start'], False)
+        self.assertEqual(conf.rules['truthy']['level'], 'error')
+        self.assertEqual(conf.rules['trailing-spaces']['level'], 'error')
+        self.assertNotIn('comments', [r.ID for r in conf.enabled_rules(None)])
+
     def test_invalid_rule_ignore_from_file(self):
         self.assertRaises(
             config.YamlLintConfigError,
@@ -225,6 +330,85 @@ class SimpleConfigTestCase(unittest.TestCase):
                 'invalid config: locale should be a string'):
             config.YamlLintConfig('locale: yes\n')
 
+    def test_invalid_respect_gitignore(self):
+        with self.assertRaisesRegex(
+                config.YamlLintConfigError,
+                'invalid config: respect-gitignore should be a bool'):
+            config.YamlLintConfig('respect-gitignore: .gitignore\n')
+
+    def test_compiled_rules(self):
+        conf = config.YamlLintConfig('rules:\n'
+                                     '  key-ordering:\n'
+                                     '    ignored-keys: ["^b"]\n'
+                                     '  truthy: disable\n'
+                                     '  colons: enable\n')
+        self.assertEqual(list(conf.compiled), ['key-ordering'])
+        state = conf.compiled['key-ordering']
+        self.assertEqual([r.pattern for r in state['ignored-keys']], ['^b'])
+        self.assertEqual(state['level'], 'error')
+        with self.assertRaises(TypeError):
+            state['level'] = 'warning'
+        self.assertEqual(conf.rules['key-ordering']['ignored-keys'], ['^b'])
+
+        with self.assertRaisesRegex(
+                config.YamlLintConfigError,
+                'invalid config: quoted-strings: unterminated character set'):
+            config.YamlLintConfig('rules:\n'
+                                  '  quoted-strings:\n'
+                                  '    required: false\n'
+                                  '    extra-required: ["[a"]\n')
+
+    def test_compiled_rules_follow_changes(self):
+        conf = config.YamlLintConfig('rules:\n'
+                                     '  key-ordering: {level: warning}\n'
+                                     '  truthy: enable\n')
+        self.assertEqual(sorted(conf.compiled), ['key-ordering', 'truthy'])
+        conf.disable_warnings()
+        self.assertEqual(list(conf.compiled), ['truthy'])
+        conf.select_rules(ignore=['truthy'])
+        self.assertEqual(conf.compiled, {})
+        conf.select_rules(['quoted-strings'])
+        self.assertEqual(list(conf.compiled), ['quoted-strings'])
+
+        old = config.YamlLintConfig('rules:\n'
+                                    '  key-ordering: enable\n'
+                                    '  truthy: enable\n')
+        new = config.YamlLintConfig('rules:\n'
+                                    '  truthy: disable\n')
+        new.extend(old)
+        self.assertEqual(list(new.compiled), ['key-ordering'])
+
+    def test_extended_rules_validated_once(self):
+        base = config.YamlLintConfig('extends: default')
+        with mock.patch('yamllint.config.validate_rule_conf',
+                        wraps=config.validate_rule_conf) as validate:
+            conf = config.YamlLintConfig('extends: default\n'
+                                         'rules:\n'
+                                         '  colons: enable\n')
+        # Once in the base configuration, once after merging
+        self.assertEqual(validate.call_count, 2 * len(base.rules))
+        self.assertEqual(sorted(conf.compiled), sorted(base.compiled))
+
+    def test_invalid_check_syntax(self):
+        with self.assertRaisesRegex(
+                config.YamlLintConfigError,
+                'invalid config: check-syntax should be a bool'):
+            config.YamlLintConfig('check-syntax: disable\n')
+
+    def test_invalid_fast_json(self):
+        with self.assertRaisesRegex(
+                config.YamlLintConfigError,
+                'invalid config: fast-json should be a bool'):
+            config.YamlLintConfig('fast-json: enable\n')
+
+    def test_invalid_max_file_size(self):
+        for value in ('1 MB', 'true', '-1', '0'):
+            with self.assertRaisesRegex(
+                    config.YamlLintConfigError,
+                    'invalid config: max-file-size should be a positive '
+                    'number of bytes'):
+                config.YamlLintConfig(f'max-file-size: {value}\n')
+
     def test_invalid_yaml_files(self):
         with self.assertRaisesRegex(
                 config.YamlLintConfigError,
@@ -232,6 +416,47 @@ class SimpleConfigTestCase(unittest.TestCase):
                 'patterns'):
             config.YamlLintConfig('yaml-files: yes\n')
 
+    def test_is_yaml_file(self):
+        c = config.YamlLintConfig('extends: default\n')
+        self.assertTrue(c.is_yaml_file('dir/file.yaml'))
+        self.assertTrue(c.is_yaml_file('dir/file.yml'))
+        self.assertTrue(c.is_yaml_file('dir/.yamllint'))
+        self.assertFalse(c.is_yaml_file('dir/file.json'))
+        self.assertFalse(c.is_yaml_file('dir/not.yamllint'))
+
+        c = config.YamlLintConfig('yaml-files: ["*.y?ml", "conf-*"]\n')
+        self.assertTrue(c.is_yaml_file('dir/file.yaml'))
+        self.assertTrue(c.is_yaml_file('dir/conf-prod'))
+        self.assertFalse(c.is_yaml_file('dir/file.yaaml'))
+
+    def test_split_basename_patterns(self):
+        self.assertEqual(
+            config.split_basename_patterns(['*.yaml', '*.yml', '.yamllint']),
+            ({'.yamllint'}, ('.yaml', '.yml')))
+        self.assertIsNone(config.split_basename_patterns(['*']))
+        self.assertIsNone(config.split_basename_patterns(['*.y?ml']))
+        self.assertIsNone(config.split_basename_patterns(['dir/*.yaml']))
+        self.assertIsNone(config.split_basename_patterns(['!a.yaml']))
+        self.assertIsNone(config.split_basename_patterns(['**/*.yaml']))
+
+    def test_is_dir_ignored(self):
+        c = config.YamlLintConfig('extends: default\n')
+        self.assertFalse(c.is_dir_ignored('node_modules'))
+
+        c = config.YamlLintConfig('ignore: |\n'
+                                  '  node_modules/\n'
+                                  '  /build\n')
+        self.assertTrue(c.is_dir_ignored('node_modules'))
+        self.assertTrue(c.is_dir_ignored('./sub/node_modules'))
+        self.assertTrue(c.is_dir_ignored('build'))
+        self.assertFalse(c.is_dir_ignored('sub/build'))
+        self.assertFalse(c.is_dir_ignored('src'))
+
+        c = config.YamlLintConfig('ignore: |\n'
+                                  '  /bin/\n'
+                                  '  !/bin/*.lint-me-anyway.yaml\n')
+        self.assertFalse(c.is_dir_ignored('bin'))
+
 
 class ExtendedConfigTestCase(unittest.TestCase):
     def test_extend_on_object(self):
@@ -15,7 +15,11 @@
 
 import io
 import unittest
+from unittest import mock
 
+import yaml
+
+import yamllint.rules
 from yamllint import linter
 from yamllint.config import YamlLintConfig
 
@@ -64,3 +68,332 @@ class LinterTestCase(unittest.TestCase):
         problem = linter.LintProblem(1, 2, 'problem', 'rule-id')
 
         self.assertEqual(str(problem), '1:2: problem (rule-id)')
+
+    def test_batch_runner_reuses_problems(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'rules:\n'
+                              '  trailing-spaces:\n'
+                              '    ignore: generated/\n')
+        batch = linter.BatchRunner(conf)
+        source = '---\nkey: value \n'
+
+        first = batch.run(source, 'a.yaml')
+        self.assertEqual(first, list(linter.run(source, conf, 'a.yaml')))
+        self.assertEqual(batch.run(io.StringIO(source), 'b.yaml'), first)
+        self.assertEqual((batch.linted, batch.saved), (1, 1))
+
+        # Different enabled rules: not a duplicate
+        self.assertEqual(batch.run(source, 'generated/c.yaml'), [])
+        self.assertEqual((batch.linted, batch.saved), (2, 1))
+
+        self.assertEqual(batch.run('---\nkey: value\n', 'd.yaml'), [])
+        self.assertEqual((batch.linted, batch.saved), (3, 1))
+
+        self.assertRaises(TypeError, batch.run, 42)
+
+    def test_batch_runner_cache_size(self):
+        conf = YamlLintConfig('extends: default')
+        batch = linter.BatchRunner(conf, cache_size=2)
+        sources = [f'---\na: {i}\n---\nb: {i}\n' for i in range(3)]
+        for source in sources:
+            batch.run(source)
+        self.assertEqual((batch.linted, batch.saved), (3, 0))
+        self.assertEqual((len(batch._problems), len(batch._documents)),
+                         (2, 2))
+
+        # The least recently used source was dropped
+        batch.run(sources[2])
+        self.assertEqual((batch.linted, batch.saved), (3, 1))
+        batch.run(sources[0])
+        self.assertEqual((batch.linted, batch.saved), (4, 1))
+        batch.run(sources[2])
+        self.assertEqual((batch.linted, batch.saved), (4, 2))
+
+    def test_split_documents(self):
+        self.assertEqual(linter.split_documents('a: 1\n'), [(0, 'a: 1\n')])
+        self.assertEqual(
+            linter.split_documents('---\na: 1\n--- b\n---\n---x\n'),
+            [(0, '---\na: 1\n'), (2, '--- b\n'), (3, '---\n---x\n')])
+        self.assertEqual(
+            linter.split_documents('# c\n---\na: |\n  ---\n'),
+            [(0, '# c\n'), (1, '---\na: |\n  ---\n')])
+
+    def test_run_reuses_identical_documents(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'rules:\n'
+                              '  key-duplicates: {level: warning}\n')
+        document = ('---\n'
+                    'key: value \n'
+                    'list: [a,  b]\n'
+                    'key: other\n')
+        source = document * 2 + '# yamllint disable\n' + document * 2
+
+        with mock.patch('yamllint.linter.get_token_and_comment_events',
+                        wraps=linter.get_token_and_comment_events) as m:
+            problems = list(linter.run(source, conf))
+        # Documents 1 (no indentation state carried over yet), 2 (followed by
+        # a comment) and 3 are linted, document 4 reuses results of 3.
+        self.assertEqual(m.call_count, 3)
+
+        self.assertEqual(
+            [(p.line, p.column, p.rule, p.level) for p in problems],
+            [(2, 11, 'trailing-spaces', 'error'),
+             (3, 11, 'commas', 'error'),
+             (4, 1, 'key-duplicates', 'warning'),
+             (6, 11, 'trailing-spaces', 'error'),
+             (7, 11, 'commas', 'error'),
+             (8, 1, 'key-duplicates', 'warning')])
+
+    def test_batch_runner_keeps_no_buffers(self):
+        conf = YamlLintConfig('extends: default\n')
+        batch = linter.BatchRunner(conf)
+        source = ('---\n'
+                  '# comment\n'
+                  'key: value  \n'
+                  'list: [a,  b]  # yamllint disable-line rule:commas\n'
+                  '# yamllint disable rule:trailing-spaces\n') * 3
+        problems = batch.run(source)
+        self.assertEqual(problems, list(linter.run(source, conf)))
+        self.assertEqual([(p.line, p.rule) for p in problems],
+                         [(3, 'trailing-spaces')])
+
+        # Only yamllint directives are kept, without the documents' buffers
+        comments = [comment for entry in batch._documents.values()
+                    for _line_no, _problems, comment in entry[0]
+                    if comment is not None]
+        self.assertEqual(
+            [(str(comment), comment.is_inline()) for comment in comments],
+            2 * [('# yamllint disable-line rule:commas', True),
+                 ('# yamllint disable rule:trailing-spaces', False)])
+        for comment in comments:
+            self.assertNotIn('\n', comment.buffer)
+
+    def test_run_documents_carry_indentation(self):
+        conf = YamlLintConfig('extends: default')
+        source = ('---\n'
+                  'a:\n'
+                  '    b: 1\n'
+                  '---\n'
+                  'a:\n'
+                  '  b: 1\n'
+                  '---\n'
+                  'a:\n'
+                  '  b: 1\n')
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [(6, 3, 'indentation'), (9, 3, 'indentation')])
+
+    def test_run_documents_with_syntax_error(self):
+        conf = YamlLintConfig('extends: default')
+        source = ('---\n'
+                  'a: [1, 2\n'
+                  '---\n'
+                  'b: 1\n')
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [(3, 1, None), (4, 1, 'indentation'), (4, 2, 'indentation')])
+
+    def test_directives_without_comment_rules(self):
+        conf = YamlLintConfig('rules:\n'
+                              '  colons: enable\n'
+                              '  trailing-spaces: enable\n')
+        source = ('# not a directive\n'
+                  'a  : 1  # yamllint disable-line rule:colons\n'
+                  'b  : 2 \n'
+                  '# yamllint disable rule:trailing-spaces\n'
+                  'c  : 3 \n')
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [(3, 3, 'colons'), (3, 7, 'trailing-spaces'), (5, 3, 'colons')])
+
+    def test_run_line_rules_only(self):
+        conf = YamlLintConfig('check-syntax: false\n'
+                              'rules:\n'
+                              '  trailing-spaces: enable\n'
+                              '  line-length: {max: 10}\n')
+        source = ('key: [unclosed \n'
+                  'a: "# yamllint disable"  \n'
+                  '# yamllint disable rule:line-length\n'
+                  'very long line \n'
+                  'x: 1  # yamllint disable-line\n'
+                  'y: 2  # no yamllint disable-line\n')
+        with mock.patch('yamllint.parser.token_or_comment_generator') as s, \
+                mock.patch('yamllint.linter.get_syntax_error') as p:
+            problems = list(linter.run(source, conf))
+        s.assert_not_called()
+        p.assert_not_called()
+        self.assertEqual(sorted((p.line, p.column, p.rule) for p in problems),
+                         [(1, 11, 'line-length'), (1, 15, 'trailing-spaces'),
+                          (2, 11, 'line-length'), (2, 24, 'trailing-spaces'),
+                          (4, 15, 'trailing-spaces')])
+
+        conf.check_syntax = True
+        self.assertIn((2, 2, None), [(p.line, p.column, p.rule)
+                                     for p in linter.run(source, conf)])
+
+    def test_run_fast_json(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'fast-json: true\n'
+                              'rules:\n'
+                              '  line-length: {max: 20}\n')
+        source = ('{"a": [1,2],   "b" :{"c": null}, \n'
+                  ' "d": "e"}')
+        with mock.patch('yamllint.parser.token_or_comment_generator') as s, \
+                mock.patch('yamllint.linter.get_syntax_error') as p:
+            problems = list(linter.run(source, conf))
+        s.assert_not_called()
+        p.assert_not_called()
+        self.assertEqual([(p.line, p.column, p.rule) for p in problems],
+                         [(1, 21, 'line-length'),
+                          (1, 33, 'trailing-spaces'),
+                          (2, 11, 'new-line-at-end-of-file')])
+
+        # Duplicated keys are located by scanning tokens
+        source = ('[{"a": 1, "b": 2},\n'
+                  ' {"a": 1,\n'
+                  '  "\\u0061": 2}]\n')
+        self.assertEqual([(p.line, p.column, p.rule)
+                          for p in linter.run(source, conf)],
+                         [(3, 3, 'key-duplicates')])
+
+        # Sources that are not JSON are linted as YAML
+        for source in ('{a: 1}\n', '[1, 2] # comment\n', '{"a": 1}\n---\n'):
+            self.assertEqual(
+                [(p.line, p.column, p.rule)
+                 for p in linter.run(source, conf)],
+                [(p.line, p.column, p.rule)
+                 for p in linter.run(source, YamlLintConfig(
+                     'extends: default\n'
+                     'rules: {line-length: {max: 20}}'))])
+
+    def test_run_syntax_error_without_warnings(self):
+        # Disabling warning-level rules doesn't change the errors shown around
+        # a syntax error
+        source = ('---\n'
+                  'foo: bar\n'
+                  '...\n'
+                  'second: document\n'
+                  'key:   value\n')
+        conf = YamlLintConfig('extends: default')
+        errors = [(p.line, p.column, p.rule)
+                  for p in linter.run(source, conf) if p.level == 'error']
+        self.assertEqual(errors, [(4, 1, None), (5, 7, 'colons')])
+        conf.disable_warnings()
+        self.assertEqual([(p.line, p.column, p.rule)
+                          for p in linter.run(source, conf)], errors)
+
+    def test_check_syntax(self):
+        self.assertEqual(linter.check_syntax('key:   value \n'), [])
+        self.assertEqual(linter.check_syntax(io.StringIO('- a\nb: c\n')),
+                         [linter.LintProblem(2, 1)])
+        self.assertEqual(linter.check_syntax('# yamllint disable-file\n'
+                                             '- a\nb: c\n'), [])
+        self.assertEqual(linter.check_syntax(b'key: value\n'), [])
+        self.assertEqual(linter.check_syntax(io.BytesIO(b'- a\nb: c\n')),
+                         [linter.LintProblem(2, 1)])
+        self.assertEqual(linter.check_syntax(b'# yamllint disable-file\n'
+                                             b'- a\nb: c\n'), [])
+        self.assertRaises(TypeError, linter.check_syntax, 42)
+
+        # The messages depend on the parser, not the problems
+        with mock.patch('yamllint.linter.FAST_LOADER', yaml.BaseLoader):
+            problems = linter.check_syntax('---\nkey: [value\n')
+        self.assertEqual([p.message for p in problems],
+                         [p.message for p in linter.run('---\nkey: [value\n',
+                                                        self.fake_config())])
+
+    def test_run_max_problems(self):
+        conf = YamlLintConfig('rules:\n'
+                              '  trailing-spaces: {max-problems: 2}\n'
+                              '  colons: {max-problems: 0, level: warning}\n')
+        source = ('a: 1 \n'
+                  'b  : 2 # yamllint disable-line rule:trailing-spaces\n'
+                  'c: 3 \n'
+                  'd  : 4 \n'
+                  'e: 5 \n')
+        with mock.patch('yamllint.rules.trailing_spaces.check',
+                        wraps=yamllint.rules.trailing_spaces.check) as check:
+            problems = list(linter.run(source, conf))
+        self.assertEqual(
+            [(p.line, p.column, p.rule, p.level, p.desc) for p in problems],
+            [(1, 5, 'trailing-spaces', 'error', 'trailing spaces'),
+             (2, 3, 'colons', 'warning',
+              'more problems not reported (max-problems: 0)'),
+             (3, 5, 'trailing-spaces', 'error', 'trailing spaces'),
+             (4, 7, 'trailing-spaces', 'error',
+              'more problems not reported (max-problems: 2)')])
+        self.assertEqual(check.call_count, 4)
+
+    def test_run_max_problems_with_directives(self):
+        # Directives still know about all rules once one of them is capped
+        conf = YamlLintConfig('rules:\n'
+                              '  colons: enable\n'
+                              '  comments: enable\n'
+                              '  trailing-spaces: {max-problems: 1}\n')
+        source = ('a: 1 \n'
+                  'b: 2 \n'
+                  'c:   3  # yamllint disable-line rule:colons\n'
+                  'd:   4  # yamllint disable-line\n'
+                  '# yamllint disable-line rule:comments\n'
+                  'e: 5  #comment\n'
+                  'f:   6  #comment\n')
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [(1, 5, 'trailing-spaces'),
+             (2, 5, 'trailing-spaces'),
+             (7, 5, 'colons'),
+             (7, 10, 'comments')])
+
+    def test_batch_runner_max_problems(self):
+        runner = linter.BatchRunner(YamlLintConfig('extends: default'), 2)
+        problems = runner.run('a: 1 \nb:  2 \nc: 3 \n')
+        self.assertEqual(
+            [(p.line, p.column, p.rule, p.level) for p in problems],
+            [(1, 1, 'document-start', 'warning'),
+             (1, 5, 'trailing-spaces', 'error'),
+             (2, 4, None, 'error')])
+        self.assertEqual(
+            problems[-1].desc,
+            'more problems not reported (max-problems-per-file: 2)')
+
+    def test_run_max_problems_of_all_rules(self):
+        conf = YamlLintConfig('rules:\n'
+                              '  trailing-spaces: {max-problems: 1}\n')
+        source = 'a: 1 \nb: 2 \n' + 1000 * 'c: 3 \n'
+        with mock.patch('yamllint.rules.trailing_spaces.check',
+                        wraps=yamllint.rules.trailing_spaces.check) as check:
+            problems = list(linter.run(source, conf))
+        self.assertEqual([(p.line, p.column) for p in problems],
+                         [(1, 5), (2, 5)])
+        self.assertEqual(check.call_count, 2)
+
+    def test_run_skips_prefiltered_rules(self):
+        conf = YamlLintConfig('extends: default\n'
+                              'rules:\n'
+                              '  truthy: enable\n'
+                              '  document-start: disable\n')
+        source = 'key: value\nlist:\n  - item  \n'
+        with mock.patch('yamllint.rules.braces.check') as braces, \
+                mock.patch('yamllint.rules.comments.check') as comments, \
+                mock.patch('yamllint.rules.truthy.check') as truthy:
+            problems = list(linter.run(source, conf))
+        braces.assert_not_called()
+        comments.assert_not_called()
+        truthy.assert_not_called()
+        self.assertEqual([(p.line, p.column, p.rule) for p in problems],
+                         [(3, 9, 'trailing-spaces')])
+
+        source = 'key: {a: on}  # comment\nlist: [yes,  no]\n'
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [(1, 10, 'truthy'), (2, 8, 'truthy'), (2, 13, 'commas'),
+             (2, 14, 'truthy')])
+
+        conf.select_rules(['braces', 'truthy'], ['truthy'])
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [])
+        conf.select_rules(['braces', 'commas'])
+        self.assertEqual(
+            [(p.line, p.column, p.rule) for p in linter.run(source, conf)],
+            [(2, 13, 'commas')])
@@ -18,9 +18,13 @@ import unittest
 import yaml
 
 from yamllint.parser import (
+    MAPPING,
+    SEQUENCE,
     Comment,
     Line,
+    Structure,
     Token,
+    directive_comment_generator,
     line_generator,
     token_or_comment_generator,
     token_or_comment_or_line_generator,
@@ -155,3 +159,71 @@ class ParserTestCase(unittest.TestCase):
         self.assertIsInstance(e[8], Comment)
         self.assertIsInstance(e[9], Line)
         self.assertIsInstance(e[12], Line)
+
+    def test_structure(self):
+        seen = []
+        structure = Structure()
+        tokens = list(yaml.scan('a: [b, {c: d}]\n'
+                                'e: 1\n'
+                                'a: 2\n'
+                                '---\n'
+                                '- [f: 3]\n'))
+        for curr, next in zip(tokens, tokens[1:] + [None]):
+            structure.update(curr, next)
+            seen.append((type(curr).__name__,
+                         tuple(n.kind for n in structure.stack),
+                         structure.flow_depth, structure.document_index,
+                         structure.key,
+                         structure.node and sorted(structure.node.keys)))
+
+        self.assertEqual(seen, [
+            ('StreamStartToken', (), 0, -1, None, None),
+            ('BlockMappingStartToken', (MAPPING,), 0, 0, None, []),
+            ('KeyToken', (MAPPING,), 0, 0, 'a', []),
+            ('ScalarToken', (MAPPING,), 0, 0, None, ['a']),
+            ('ValueToken', (MAPPING,), 0, 0, None, ['a']),
+            ('FlowSequenceStartToken', (MAPPING, SEQUENCE), 1, 0, None, []),
+            ('ScalarToken', (MAPPING, SEQUENCE), 1, 0, None, []),
+            ('FlowEntryToken', (MAPPING, SEQUENCE), 1, 0, None, []),
+            ('FlowMappingStartToken', (MAPPING, SEQUENCE, MAPPING), 2, 0,
+             None, []),
+            ('KeyToken', (MAPPING, SEQUENCE, MAPPING), 2, 0, 'c', []),
+            ('ScalarToken', (MAPPING, SEQUENCE, MAPPING), 2, 0, None, ['c']),
+            ('ValueToken', (MAPPING, SEQUENCE, MAPPING), 2, 0, None, ['c']),
+            ('ScalarToken', (MAPPING, SEQUENCE, MAPPING), 2, 0, None, ['c']),
+            ('FlowMappingEndToken', (MAPPING, SEQUENCE), 1, 0, None, []),
+            ('FlowSequenceEndToken', (MAPPING,), 0, 0, None, ['a']),
+            ('KeyToken', (MAPPING,), 0, 0, 'e', ['a']),
+            ('ScalarToken', (MAPPING,), 0, 0, None, ['a', 'e']),
+            ('ValueToken', (MAPPING,), 0, 0, None, ['a', 'e']),
+            ('ScalarToken', (MAPPING,), 0, 0, None, ['a', 'e']),
+            ('KeyToken', (MAPPING,), 0, 0, 'a', ['a', 'e']),
+            ('ScalarToken', (MAPPING,), 0, 0, None, ['a', 'e']),
+            ('ValueToken', (MAPPING,), 0, 0, None, ['a', 'e']),
+            ('ScalarToken', (MAPPING,), 0, 0, None, ['a', 'e']),
+            ('BlockEndToken', (), 0, 0, None, None),
+            ('DocumentStartToken', (), 0, 1, None, None),
+            ('BlockSequenceStartToken', (SEQUENCE,), 0, 1, None, []),
+            ('BlockEntryToken', (SEQUENCE,), 0, 1, None, []),
+            ('FlowSequenceStartToken', (SEQUENCE, SEQUENCE), 1, 1, None, []),
+            ('KeyToken', (SEQUENCE, SEQUENCE), 1, 1, None, []),
+            ('ScalarToken', (SEQUENCE, SEQUENCE), 1, 1, None, []),
+            ('ValueToken', (SEQUENCE, SEQUENCE), 1, 1, None, []),
+            ('ScalarToken', (SEQUENCE, SEQUENCE), 1, 1, None, []),
+            ('FlowSequenceEndToken', (SEQUENCE,), 0, 1, None, []),
+            ('BlockEndToken', (), 0, 1, None, None),
+            ('StreamEndToken', (), 0, 1, None, None),
+        ])
+
+    def test_directive_comment_generator(self):
+        e = list(directive_comment_generator(
+            '# yamllint disable\n'
+            'a: b # yamllint disable-line\n'
+            'c: d#yamllint enable\n'
+            'e: f  # comment # yamllint enable\n'
+            '  # yamllint enable rule:colons'))
+        self.assertEqual([(c.line_no, c.column_no, str(c), c.is_inline())
+                          for c in e],
+                         [(1, 1, '# yamllint disable', False),
+                          (2, 6, '# yamllint disable-line', True),
+                          (5, 3, '# yamllint enable rule:colons', False)])
@@ -14,29 +14,231 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import argparse
+import concurrent.futures
 import locale
 import os
 import platform
+import subprocess
 import sys
 
+import pathspec
+
 from yamllint import APP_DESCRIPTION, APP_NAME, APP_VERSION, linter
 from yamllint.config import YamlLintConfig, YamlLintConfigError
 from yamllint.linter import PROBLEM_LEVELS
 
+#: Minimum number of files for syntax checks to be run by worker processes:
+#: below that, starting the pool costs more than it saves
+SYNTAX_CHECK_POOL_MIN_FILES = 16
+
 
 def find_files_recursively(items, conf):
     for item in items:
         if os.path.isdir(item):
-            for root, _dirnames, filenames in os.walk(item):
-                for f in filenames:
-                    filepath = os.path.join(root, f)
-                    if (conf.is_yaml_file(filepath) and
-                            not conf.is_file_ignored(filepath)):
-                        yield filepath
+            yield from walk_directory(item, conf)
         else:
             yield item
 
 
+def walk_directory(path, conf):
+    """Yields YAML files found under a directory, without descending into
+    ignored directories."""
+    gitignores = find_parent_gitignores(path) if conf.respect_gitignore else ()
+    stack = [(path, gitignores)]
+    while stack:
+        dirpath, gitignores = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        if conf.respect_gitignore:
+            gitignores += load_gitignores(dirpath, entries)
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                # Like os.walk(), don't follow symbolic links to directories
+                if (not entry.is_symlink() and
+                        not conf.is_dir_ignored(entry.path) and
+                        not (conf.respect_gitignore and (
+                            entry.name == '.git' or
+                            is_gitignored(entry.path + '/', gitignores)))):
+                    subdirs.append((entry.path, gitignores))
+            elif (conf.is_yaml_file(entry.name) and
+                    not conf.is_file_ignored(entry.path) and
+                    not (gitignores and
+                         is_gitignored(entry.path, gitignores))):
+                yield entry.path
+
+        stack.extend(reversed(subdirs))
+
+
+def read_gitignore(filepath):
+    try:
+        with open(filepath) as f:
+            return pathspec.PathSpec.from_lines('gitwildmatch', f)
+    except OSError:
+        return None
+
+
+def git_exclude_file(directory):
+    """Returns the path of the info/exclude file of the git repository rooted
+    at `directory`. In submodules and worktrees, .git is a file pointing to
+    the actual git directory."""
+    gitdir = os.path.join(directory, '.git')
+    if not os.path.isdir(gitdir):
+        try:
+            with open(gitdir) as f:
+                line = f.readline().strip()
+        except OSError:
+            return None
+        if not line.startswith('gitdir:'):
+            return None
+        gitdir = os.path.join(directory, line[7:].strip())
+        # Worktrees share the info directory of their main repository
+        try:
+            with open(os.path.join(gitdir, 'commondir')) as f:
+                gitdir = os.path.join(gitdir, f.read().strip())
+        except OSError:
+            pass
+    return os.path.join(gitdir, 'info', 'exclude')
+
+
+def load_gitignores(dirpath, entries):
+    """Compiles the ignore files that apply below `dirpath`: its .gitignore,
+    and .git/info/exclude if it is the root of a git repository."""
+    names = {entry.name for entry in entries}
+    # .gitignore has precedence over .git/info/exclude, so it comes last
+    filepaths = []
+    if '.git' in names:
+        filepaths.append(git_exclude_file(dirpath))
+    if '.gitignore' in names:
+        filepaths.append(os.path.join(dirpath, '.gitignore'))
+
+    prefix = os.path.join(dirpath, '')
+    specs = (read_gitignore(filepath) for filepath in filepaths if filepath)
+    return tuple((prefix, '', spec) for spec in specs if spec is not None)
+
+
+def find_parent_gitignores(path):
+    """Compiles the ignore files of the directories above `path`, up to the
+    root of the git repository it belongs to (if any)."""
+    prefix = os.path.join(path, '')
+    abspath = os.path.abspath(path)
+    directory = abspath
+    gitignores = []
+    # In submodules and worktrees, .git is a file
+    while not os.path.exists(os.path.join(directory, '.git')):
+        parent = os.path.dirname(directory)
+        if parent == directory:  # not in a git repository
+            return ()
+        directory = parent
+
+        rel_prefix = os.path.relpath(abspath, directory)
+        rel_prefix = rel_prefix.replace(os.sep, '/') + '/'
+        filepaths = [os.path.join(directory, '.gitignore')]
+        if os.path.exists(os.path.join(directory, '.git')):
+            filepaths.append(git_exclude_file(directory))
+        for filepath in filepaths:
+            spec = filepath and read_gitignore(filepath)
+            if spec is not None:
+                gitignores.append((prefix, rel_prefix, spec))
+    return tuple(reversed(gitignores))
+
+
+def is_gitignored(path, gitignores):
+    """Tells whether a path (ending with '/' for a directory) is ignored by
+    git, the last matching pattern of the deepest ignore file winning."""
+    for prefix, rel_prefix, spec in reversed(gitignores):
+        relpath = rel_prefix + path[len(prefix):].replace(os.sep, '/')
+        for pattern in reversed(spec.patterns):
+            if pattern.include is not None and pattern.regex.match(relpath):
+                return pattern.include
+    return False
+
+
+def git(directory, *args):
+    """Runs a git command in `directory` and returns its output."""
+    return os.fsdecode(subprocess.run(('git', '-C', directory) + args,
+                                      check=True, capture_output=True).stdout)
+
+
+def git_ls_files(directory):
+    """Lists files under `directory` that are in the git index."""
+    return git(directory, 'ls-files', '-z', '--cached').split('\0')[:-1]
+
+
+def git_changed_files(directory, ref):
+    """Lists files under `directory` that changed between the merge base of
+    `ref` and HEAD, and the working tree (deleted files excluded)."""
+    base = git(directory, 'merge-base', ref, 'HEAD').strip()
+    return git(directory, 'diff', '--name-only', '--relative', '-z',
+               '--diff-filter=d', base).split('\0')[:-1]
+
+
+def find_files_in_git(items, conf, changed_since=None):
+    """Like find_files_recursively(), but lists directories from the git index
+    instead of walking them. If `changed_since` is set, only files that
+    changed since this git reference are kept."""
+    changed = {}
+    for item in items:
+        if os.path.isdir(item):
+            if changed_since is None:
+                paths = git_ls_files(item)
+            else:
+                paths = git_changed_files(item, changed_since)
+            for path in paths:
+                filepath = os.path.join(item, path)
+                if (conf.is_yaml_file(filepath) and
+                        not conf.is_file_ignored(filepath) and
+                        os.path.lexists(filepath)):
+                    yield filepath
+        elif changed_since is None:
+            yield item
+        else:
+            directory = os.path.dirname(item) or '.'
+            if directory not in changed:
+                changed[directory] = set(
+                    git_changed_files(directory, changed_since))
+            if os.path.basename(item) in changed[directory]:
+                yield item
+
+
+def check_file_syntax(file):
+    """Checks the syntax of a file only (run in worker processes)."""
+    with open(file, newline='') as f:
+        return linter.check_syntax(f)
+
+
+def start_syntax_checks(files, conf, executor):
+    """Submits syntax checks of files to an executor, except for files that
+    don't need to be read. Yields (file, future) tuples, future being None for
+    these."""
+    for file in files:
+        filepath = file.removeprefix('./')
+        try:
+            skip = (conf.is_file_ignored(filepath) or
+                    linter.get_file_size_problem(filepath, conf) is not None)
+        except OSError:
+            skip = True  # reported when the file's turn comes
+        yield file, None if skip else executor.submit(check_file_syntax, file)
+
+
+def stop_syntax_checks(executor):
+    """Shuts down an executor started by :func:`start_syntax_checks` without
+    waiting: queued checks are cancelled, and running ones are interrupted by
+    ending the worker processes."""
+    if hasattr(executor, 'terminate_workers'):  # Python >= 3.14
+        executor.terminate_workers()
+        return
+    processes = list((getattr(executor, '_processes', None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
 def supports_color():
     supported_platform = not (platform.system() == 'Windows' and not
                               ('ANSICON' in os.environ or
@@ -130,6 +332,19 @@ def show_problems(problems, file, args_format, no_warn):
     return max_level
 
 
+def until_first_error(problems):
+    """Yields problems up to the first error-level one (included)."""
+    for problem in problems:
+        yield problem
+        if problem.level == 'error':
+            return
+
+
+def split_ids(rules):
+    """Splits a comma-separated list of rule IDs."""
+    return [id.strip() for id in rules.split(',') if id.strip()]
+
+
 def find_project_config_filepath(path='.'):
     for filename in ('.yamllint', '.yamllint.yaml', '.yamllint.yml'):
         filepath = os.path.join(path, filename)
@@ -159,8 +374,19 @@ def run(argv=None):
     config_group.add_argument('-d', '--config-data', dest='config_data',
                               action='store',
                               help='custom configuration (as YAML source)')
+    parser.add_argument('--select', metavar='RULES', dest='select',
+                        help='only run these rules (comma-separated IDs), '
+                             'enabling them if needed')
+    parser.add_argument('--ignore-rules', metavar='RULES', dest='ignore_rules',
+                        help="don't run these rules (comma-separated IDs)")
     parser.add_argument('--list-files', action='store_true', dest='list_files',
                         help='list files to lint and exit')
+    parser.add_argument('--git-files', action='store_true', dest='git_files',
+                        help='list files in directories from the git index '
+                             'instead of walking them')
+    parser.add_argument('--changed-since', metavar='REF', dest='changed_since',
+                        help='only lint files that changed since the merge '
+                             'base of REF and HEAD (implies --git-files)')
     parser.add_argument('-f', '--format',
                         choices=('parsable', 'standard', 'colored', 'github',
                                  'auto'),
@@ -172,6 +398,19 @@ def run(argv=None):
     parser.add_argument('--no-warnings',
                         action='store_true',
                         help='output only error level problems')
+    parser.add_argument('--syntax-only',
+                        action='store_true',
+                        help='only check that files are valid YAML (faster, '
+                             'in parallel)')
+    parser.add_argument('--fail-fast',
+                        action='store_true',
+                        help='stop at the first error-level problem')
+    parser.add_argument('--max-problems-per-file', metavar='N', type=int,
+                        dest='max_problems_per_file',
+                        help='only report the first N problems of each file')
+    parser.add_argument('--stats',
+                        action='store_true',
+                        help='print linting statistics on standard error')
     parser.add_argument('-v', '--version', action='version',
                         version=f'{APP_NAME} {APP_VERSION}')
 
@@ -201,6 +440,11 @@ def run(argv=None):
             conf = YamlLintConfig(file=user_global_config)
         else:
             conf = YamlLintConfig('extends: default')
+        if args.select is not None or args.ignore_rules is not None:
+            conf.select_rules(
+                None if args.select is None else split_ids(args.select),
+                () if args.ignore_rules is None
+                else split_ids(args.ignore_rules))
     except YamlLintConfigError as e:
         print(e, file=sys.stderr)
         sys.exit(-1)
@@ -208,37 +452,109 @@ def run(argv=None):
     if conf.locale is not None:
         locale.setlocale(locale.LC_ALL, conf.locale)
 
+    # Warnings can't change the output nor the return code: don't look for them
+    if args.no_warnings and not args.strict:
+        conf.disable_warnings()
+
+    if args.git_files or args.changed_since is not None:
+        try:
+            files = list(find_files_in_git(args.files, conf,
+                                           args.changed_since))
+        except subprocess.CalledProcessError as e:
+            print(os.fsdecode(e.stderr).strip(), file=sys.stderr)
+            sys.exit(-1)
+        except OSError as e:
+            print(e, file=sys.stderr)
+            sys.exit(-1)
+    else:
+        files = find_files_recursively(args.files, conf)
+
     if args.list_files:
-        for file in find_files_recursively(args.files, conf):
+        for file in files:
             if not conf.is_file_ignored(file):
                 print(file)
         sys.exit(0)
 
     max_level = 0
+    checked = 0  # files actually read and checked, for --stats
+    batch = linter.BatchRunner(conf, args.max_problems_per_file)
+
+    executor = None
+    if args.syntax_only:
+        files = list(files)
+    if args.syntax_only and len(files) >= SYNTAX_CHECK_POOL_MIN_FILES:
+        # Files are all submitted at once, and their results shown in order
+        executor = concurrent.futures.ProcessPoolExecutor()
+        jobs = list(start_syntax_checks(files, conf, executor))
+    else:
+        jobs = ((file, None) for file in files)
 
-    for file in find_files_recursively(args.files, conf):
-        filepath = file.removeprefix('./')
-        try:
-            with open(file, newline='') as f:
-                problems = linter.run(f, conf, filepath)
-        except OSError as e:
-            print(e, file=sys.stderr)
-            sys.exit(-1)
-        prob_level = show_problems(problems, file, args_format=args.format,
-                                   no_warn=args.no_warnings)
-        max_level = max(max_level, prob_level)
+    try:
+        for file, future in jobs:
+            filepath = file.removeprefix('./')
+            try:
+                # Files that are too big are reported without being read
+                problem = linter.get_file_size_problem(filepath, conf)
+                if problem is not None:
+                    problems = [problem]
+                elif future is not None:
+                    problems = future.result()
+                elif args.syntax_only:
+                    problems = ([] if conf.is_file_ignored(filepath)
+                                else check_file_syntax(file))
+                elif args.fail_fast:
+                    # Problems are generated lazily, to stop at the first
+                    # error
+                    with open(file, newline='') as f:
+                        problems = linter.run(f, conf, filepath)
+                else:
+                    with open(file, newline='') as f:
+                        problems = batch.run(f, filepath)
+            except OSError as e:
+                print(e, file=sys.stderr)
+                sys.exit(-1)
+            if args.stats and not conf.is_file_ignored(filepath):
+                checked += 1
+            if args.fail_fast:
+                if args.max_problems_per_file is not None:
+                    problems = linter.limit_problems(
+                        problems, args.max_problems_per_file)
+                problems = until_first_error(problems)
+            prob_level = show_problems(problems, file,
+                                       args_format=args.format,
+                                       no_warn=args.no_warnings)
+            max_level = max(max_level, prob_level)
+            if args.fail_fast and max_level == PROBLEM_LEVELS['error']:
+                break
+    finally:
+        if executor is not None:
+            stop_syntax_checks(executor)
+
+    failed = args.fail_fast and max_level == PROBLEM_LEVELS['error']
 
     # read yaml from stdin
-    if args.stdin:
+    if args.stdin and not failed:
         try:
-            problems = linter.run(sys.stdin, conf, '')
+            if args.syntax_only:
+                problems = linter.check_syntax(sys.stdin)
+            else:
+                problems = linter.run(sys.stdin, conf, '')
         except OSError as e:
             print(e, file=sys.stderr)
             sys.exit(-1)
+        if args.max_problems_per_file is not None:
+            problems = linter.limit_problems(problems,
+                                             args.max_problems_per_file)
+        if args.fail_fast:
+            problems = until_first_error(problems)
         prob_level = show_problems(problems, 'stdin', args_format=args.format,
                                    no_warn=args.no_warnings)
         max_level = max(max_level, prob_level)
 
+    if args.stats:
+        print(f'{checked} files checked, {batch.saved} lints saved on '
+              f'duplicate contents', file=sys.stderr)
+
     if max_level == PROBLEM_LEVELS['error']:
         return_code = 1
     elif max_level == PROBLEM_LEVELS['warning']:
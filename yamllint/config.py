@@ -34,9 +34,19 @@ class YamlLintConfig:
 
         self.yaml_files = pathspec.PathSpec.from_lines(
             'gitwildmatch', ['*.yaml', '*.yml', '.yamllint'])
+        self._yaml_files_fast = split_basename_patterns(
+            ['*.yaml', '*.yml', '.yamllint'])
 
         self.locale = None
 
+        self.respect_gitignore = False
+
+        self.check_syntax = True
+
+        self.max_file_size = None
+
+        self.fast_json = False
+
         if file is not None:
             with open(file) as f:
                 content = f.read()
@@ -47,16 +57,76 @@ class YamlLintConfig:
     def is_file_ignored(self, filepath):
         return self.ignore and self.ignore.match_file(filepath)
 
-    def is_yaml_file(self, filepath):
-        return self.yaml_files.match_file(os.path.basename(filepath))
+    def is_dir_ignored(self, dirpath):
+        """Tells whether every file under a directory is ignored, in which
+        case the directory doesn't need to be walked at all."""
+        if not self.ignore or any(p.include is False
+                                  for p in self.ignore.patterns):
+            # A negated pattern could re-include files inside an ignored
+            # directory: only files can tell.
+            return False
+        return self.ignore.match_file(os.path.join(dirpath, ''))
 
-    def enabled_rules(self, filepath):
+    def is_yaml_file(self, filepath):
+        basename = os.path.basename(filepath)
+        if self._yaml_files_fast is not None:
+            names, suffixes = self._yaml_files_fast
+            return basename in names or basename.endswith(suffixes)
+        return self.yaml_files.match_file(basename)
+
+    def enabled_rules(self, filepath, buffer=None):
+        """Returns the rules to run on `filepath`. If `buffer` is given, rules
+        whose prefilter doesn't match it (so that can't report anything on
+        it) are left out."""
+        if not isinstance(buffer, str):
+            buffer = None
         return [yamllint.rules.get(id) for id, val in self.rules.items()
                 if val is not False and (
                     filepath is None or 'ignore' not in val or
-                    not val['ignore'].match_file(filepath))]
+                    not val['ignore'].match_file(filepath)) and (
+                    buffer is None or id not in self.prefilters or
+                    self.prefilters[id].search(buffer))]
+
+    def select_rules(self, select=None, ignore=()):
+        """Only keeps the rules listed in `select` (if not None), and disables
+        the ones listed in `ignore`. Selected rules that are disabled are
+        enabled with their default options."""
+        try:
+            for id in (*(select or ()), *ignore):
+                yamllint.rules.get(id)
+        except ValueError as e:
+            raise YamlLintConfigError(f'invalid config: {e}') from e
+
+        if select is not None:
+            for id in self.rules:
+                if id not in select:
+                    self.rules[id] = False
+            for id in select:
+                if self.rules.get(id, False) is False:
+                    rule = yamllint.rules.get(id)
+                    self.rules[id] = validate_rule_conf(rule, {})
+
+        for id in ignore:
+            self.rules[id] = False
+
+        self._compile_rules()
+
+    def disable_warnings(self):
+        """Disables warning-level rules, when their problems would be thrown
+        away anyway."""
+        for id, rule_conf in self.rules.items():
+            if rule_conf is not False and rule_conf['level'] == 'warning':
+                self.rules[id] = False
+
+        self._compile_rules()
 
     def extend(self, base_config):
+        """Overrides the options of `base_config` with the ones of this
+        configuration, and validates the result."""
+        self._merge(base_config)
+        self.validate()
+
+    def _merge(self, base_config):
         assert isinstance(base_config, YamlLintConfig)
 
         for rule in self.rules:
@@ -93,7 +163,10 @@ class YamlLintConfig:
             path = get_extended_config_file(conf['extends'])
             base = YamlLintConfig(file=path)
             try:
-                self.extend(base)
+                # Merged options are validated once parsing is done
+                self._merge(base)
+            except YamlLintConfigError:
+                raise
             except Exception as e:
                 raise YamlLintConfigError(f'invalid config: {e}') from e
 
@@ -131,6 +204,8 @@ class YamlLintConfig:
                     'should be a list of file patterns')
             self.yaml_files = pathspec.PathSpec.from_lines('gitwildmatch',
                                                            conf['yaml-files'])
+            self._yaml_files_fast = split_basename_patterns(
+                conf['yaml-files'])
 
         if 'locale' in conf:
             if not isinstance(conf['locale'], str):
@@ -138,6 +213,33 @@ class YamlLintConfig:
                     'invalid config: locale should be a string')
             self.locale = conf['locale']
 
+        if 'respect-gitignore' in conf:
+            if not isinstance(conf['respect-gitignore'], bool):
+                raise YamlLintConfigError(
+                    'invalid config: respect-gitignore should be a bool')
+            self.respect_gitignore = conf['respect-gitignore']
+
+        if 'check-syntax' in conf:
+            if not isinstance(conf['check-syntax'], bool):
+                raise YamlLintConfigError(
+                    'invalid config: check-syntax should be a bool')
+            self.check_syntax = conf['check-syntax']
+
+        if 'fast-json' in conf:
+            if not isinstance(conf['fast-json'], bool):
+                raise YamlLintConfigError(
+                    'invalid config: fast-json should be a bool')
+            self.fast_json = conf['fast-json']
+
+        if 'max-file-size' in conf:
+            if (not isinstance(conf['max-file-size'], int) or
+                    isinstance(conf['max-file-size'], bool) or
+                    conf['max-file-size'] < 1):
+                raise YamlLintConfigError(
+                    'invalid config: max-file-size should be a positive '
+                    'number of bytes')
+            self.max_file_size = conf['max-file-size']
+
     def validate(self):
         for id in self.rules:
             try:
@@ -147,6 +249,37 @@ class YamlLintConfig:
 
             self.rules[id] = validate_rule_conf(rule, self.rules[id])
 
+        self._compile_rules()
+
+    def _compile_rules(self):
+        """Lets enabled rules precompute what they need from their options,
+        with an optional COMPILE(conf) function. What it returns (an immutable
+        object) is then passed to check() instead of the options dict.
+
+        Rules can also declare, with an optional PREFILTER(conf) function, a
+        regular expression that a buffer must match for them to report
+        anything. It is searched once per file, and the rule is skipped if it
+        doesn't match.
+
+        This must be done again whenever `rules` changes: methods changing it
+        do it, and code changing it directly must call validate()."""
+        self.compiled = {}
+        self.prefilters = {}
+        for id, rule_conf in self.rules.items():
+            if rule_conf is False:
+                continue
+            rule = yamllint.rules.get(id)
+            if hasattr(rule, 'COMPILE'):
+                try:
+                    self.compiled[id] = rule.COMPILE(rule_conf)
+                except Exception as e:
+                    raise YamlLintConfigError(
+                        f'invalid config: {id}: {e}') from e
+            if hasattr(rule, 'PREFILTER'):
+                prefilter = rule.PREFILTER(rule_conf)
+                if prefilter is not None:
+                    self.prefilters[id] = prefilter
+
 
 def validate_rule_conf(rule, conf):
     if conf is False:  # disable
@@ -185,10 +318,19 @@ def validate_rule_conf(rule, conf):
             raise YamlLintConfigError(
                 'invalid config: level should be "error" or "warning"')
 
+        if 'max-problems' in conf and (
+                not isinstance(conf['max-problems'], int) or
+                isinstance(conf['max-problems'], bool) or
+                conf['max-problems'] < 0):
+            raise YamlLintConfigError(
+                'invalid config: max-problems should be a non-negative '
+                'number')
+
         options = getattr(rule, 'CONF', {})
         options_default = getattr(rule, 'DEFAULT', {})
         for optkey in conf:
-            if optkey in ('ignore', 'ignore-from-file', 'level'):
+            if optkey in ('ignore', 'ignore-from-file', 'level',
+                          'max-problems'):
                 continue
             if optkey not in options:
                 raise YamlLintConfigError(
@@ -235,6 +377,26 @@ def validate_rule_conf(rule, conf):
     return conf
 
 
+def split_basename_patterns(patterns):
+    """Splits simple file patterns (like ``*.yaml`` or ``.yamllint``) into a
+    set of exact names and a tuple of suffixes, so that basenames can be
+    matched without regular expressions.
+
+    Returns None if any pattern is too complex to be matched this way.
+    """
+    names, suffixes = set(), []
+    for pattern in patterns:
+        body = pattern[1:] if pattern.startswith('*') else pattern
+        if (body == '' or body != body.strip() or body[0] in '!#' or
+                any(c in body for c in '*?[]\\/')):
+            return None
+        if pattern.startswith('*'):
+            suffixes.append(body)
+        else:
+            names.add(pattern)
+    return names, tuple(suffixes)
+
+
 def get_extended_config_file(name):
     # Is it a standard conf shipped with yamllint...
     if '/' not in name:
@@ -13,7 +13,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
+import hashlib
 import io
+import json
+import os
 import re
 
 import yaml
@@ -32,6 +36,14 @@ PROBLEM_LEVELS = {
 DISABLE_RULE_PATTERN = re.compile(r'^# yamllint disable( rule:\S+)*\s*$')
 ENABLE_RULE_PATTERN = re.compile(r'^# yamllint enable( rule:\S+)*\s*$')
 
+DOCUMENT_START_PATTERN = re.compile(r'^---(?=[ \t\r\n]|$)', re.MULTILINE)
+DIRECTIVE_PATTERN = re.compile(r'^%', re.MULTILINE)
+JSON_START_PATTERN = re.compile(r'[ \t\r\n]*[\[{]')
+
+# libyaml is much faster than the pure Python parser, but its error messages
+# are different: it is only used when nothing but the syntax is checked
+FAST_LOADER = getattr(yaml, 'CBaseLoader', yaml.BaseLoader)
+
 
 class LintProblem:
     """Represents a linting problem found by yamllint."""
@@ -64,19 +76,57 @@ class LintProblem:
     def __repr__(self):
         return f'{self.line}:{self.column}: {self.message}'
 
+    def shifted(self, lines):
+        """Returns a copy of this problem, moved down by a number of lines."""
+        problem = LintProblem(self.line + lines, self.column, self.desc,
+                              self.rule)
+        problem.level = self.level
+        return problem
 
-def get_cosmetic_problems(buffer, conf, filepath):
-    rules = conf.enabled_rules(filepath)
+
+def summary_problem(problem, setting, max_problems):
+    """Returns a problem standing for `problem` and the ones following it, not
+    reported because of a `setting` limiting their number."""
+    summary = LintProblem(problem.line, problem.column,
+                          f'more problems not reported ({setting}: '
+                          f'{max_problems})', problem.rule)
+    summary.level = problem.level
+    return summary
+
+
+def limit_problems(problems, max_problems):
+    """Yields at most `max_problems` problems, then a summary problem if there
+    are more, with the highest level of the problems it stands for. Syntax
+    errors are always yielded, so that a broken file can't pass."""
+    summary = None
+    syntax_errors = []
+    for count, problem in enumerate(problems):
+        if count < max_problems:
+            yield problem
+            continue
+        if summary is None:
+            summary = summary_problem(problem, 'max-problems-per-file',
+                                      max_problems)
+            summary.rule = None  # the summary covers all rules
+        elif PROBLEM_LEVELS[problem.level] > PROBLEM_LEVELS[summary.level]:
+            summary.level = problem.level
+        if problem.rule is None:
+            syntax_errors.append(problem)
+
+    if summary is not None:
+        yield summary
+        yield from syntax_errors
+
+
+def get_cosmetic_problems(buffer, conf, filepath, events=None, rules=None):
+    if rules is None:
+        rules = conf.enabled_rules(filepath, buffer)
 
     # Split token rules from line rules
     token_rules = [r for r in rules if r.TYPE == 'token']
     comment_rules = [r for r in rules if r.TYPE == 'comment']
     line_rules = [r for r in rules if r.TYPE == 'line']
 
-    context = {}
-    for rule in token_rules:
-        context[rule.ID] = {}
-
     class DisableDirective:
         def __init__(self):
             self.rules = set()
@@ -125,57 +175,288 @@ def get_cosmetic_problems(buffer, conf, filepath):
     # found. This allows the use of yamllint directive to disable some rules on
     # some lines.
     cache = []
+    # Number of problems reported for each rule, and rules that reached their
+    # "max-problems"
+    counts = {}
+    capped = set()
     disabled = DisableDirective()
     disabled_for_line = DisableLineDirective()
     disabled_for_next_line = DisableLineDirective()
 
-    for elem in parser.token_or_comment_or_line_generator(buffer):
+    # Line tokens are only recorded when scanning here
+    line_tokens = ({} if events is None and needs_line_tokens(conf, line_rules)
+                   else None)
+
+    if events is None:
+        events = get_token_and_comment_events(buffer, conf, token_rules,
+                                              comment_rules,
+                                              line_tokens=line_tokens)
+    event = next(events, None)
+
+    for line in parser.line_generator(buffer):
+        while event is not None and event[0] <= line.line_no:
+            _line_no, problems, comment = event
+            cache.extend(problems)
+
+            if comment is not None:
+                disabled.process_comment(comment)
+                if comment.is_inline():
+                    disabled_for_line.process_comment(comment)
+                else:
+                    disabled_for_next_line.process_comment(comment)
+
+            event = next(events, None)
+
+        if line_tokens is not None:
+            if line.line_no >= line_tokens.get(None, line.line_no + 1):
+                line.tokens = None  # scanning stopped on a syntax error
+            else:
+                line.tokens = line_tokens.pop(line.line_no, [])
+
+        for rule in line_rules:
+            rule_conf = conf.rules[rule.ID]
+            for problem in rule.check(conf.compiled.get(rule.ID, rule_conf),
+                                      line):
+                problem.rule = rule.ID
+                problem.level = rule_conf['level']
+                cache.append(problem)
+
+        # This is the last token/comment/line of this line, let's flush the
+        # problems found (but filter them according to the directives)
+        for problem in cache:
+            if (disabled_for_line.is_disabled_by_directive(problem) or
+                    disabled.is_disabled_by_directive(problem) or
+                    problem.rule in capped):
+                continue
+
+            count = counts[problem.rule] = counts.get(problem.rule, 0) + 1
+            max_problems = conf.rules[problem.rule].get('max-problems')
+            if max_problems is not None and count > max_problems:
+                # Stop running this rule on the rest of the buffer
+                capped.add(problem.rule)
+                for kind in (token_rules, comment_rules, line_rules):
+                    kind[:] = [r for r in kind if r.ID != problem.rule]
+                yield summary_problem(problem, 'max-problems', max_problems)
+                continue
+
+            yield problem
+
+        disabled_for_line = disabled_for_next_line
+        disabled_for_next_line = DisableLineDirective()
+        cache = []
+
+        if capped and not (token_rules or comment_rules or line_rules):
+            return  # all rules reached their max-problems
+
+
+def needs_line_tokens(conf, line_rules):
+    """Whether some line rules need the tokens of each line.
+
+    Line rules ask for them with an optional `LINE_TOKENS(conf)` function.
+    """
+    return any(rule.LINE_TOKENS(conf.rules[rule.ID])
+               for rule in line_rules if hasattr(rule, 'LINE_TOKENS'))
+
+
+def get_token_and_comment_events(buffer, conf, token_rules, comment_rules,
+                                 context=None, line_tokens=None):
+    """Runs token and comment rules on a buffer.
+
+    Yields (line_no, problems, comment) tuples, in the order of the tokens and
+    comments that produced them. Tokens that didn't produce any problem are
+    skipped.
+
+    If `line_tokens` is a dict, the tokens starting on each line are added to
+    it (keyed by line number) while scanning. If scanning stops on a syntax
+    error, the first line with incomplete tokens is stored under `None`.
+    """
+    if context is None:
+        context = {rule.ID: {} for rule in token_rules}
+
+    structure = parser.Structure()
+    for rule_context in context.values():
+        rule_context['structure'] = structure
+
+    last_token = None
+    for elem in parser.token_or_comment_generator(buffer):
+        problems = []
         if isinstance(elem, parser.Token):
+            last_token = elem
+            if line_tokens is not None:
+                line_tokens.setdefault(elem.line_no, []).append(elem.curr)
+            structure.update(elem.curr, elem.next)
             for rule in token_rules:
                 rule_conf = conf.rules[rule.ID]
-                for problem in rule.check(rule_conf,
+                for problem in rule.check(conf.compiled.get(rule.ID,
+                                                            rule_conf),
                                           elem.curr, elem.prev, elem.next,
                                           elem.nextnext,
                                           context[rule.ID]):
                     problem.rule = rule.ID
                     problem.level = rule_conf['level']
-                    cache.append(problem)
-        elif isinstance(elem, parser.Comment):
+                    problems.append(problem)
+            if problems:
+                yield elem.line_no, problems, None
+        # Without comment rules, only yamllint directives matter
+        elif (comment_rules or
+              elem.buffer.startswith('# yamllint', elem.pointer)):
             for rule in comment_rules:
                 rule_conf = conf.rules[rule.ID]
-                for problem in rule.check(rule_conf, elem):
+                for problem in rule.check(conf.compiled.get(rule.ID,
+                                                            rule_conf),
+                                          elem):
                     problem.rule = rule.ID
                     problem.level = rule_conf['level']
-                    cache.append(problem)
+                    problems.append(problem)
+            yield elem.line_no, problems, elem
 
-            disabled.process_comment(elem)
-            if elem.is_inline():
-                disabled_for_line.process_comment(elem)
+    if line_tokens is not None and (
+            last_token is None or
+            not isinstance(last_token.curr, yaml.StreamEndToken)):
+        line_tokens[None] = last_token.line_no if last_token else 1
+
+
+def split_documents(buffer):
+    """Splits a stream before each document start marker ("---" at column 0).
+
+    Returns a list of (line_offset, chunk) tuples.
+    """
+    starts = [m.start() for m in DOCUMENT_START_PATTERN.finditer(buffer)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    starts.append(len(buffer))
+
+    chunks = []
+    line_offset = 0
+    for start, end in zip(starts, starts[1:]):
+        chunk = buffer[start:end]
+        chunks.append((line_offset, chunk))
+        line_offset += chunk.count('\n')
+    return chunks
+
+
+def memoizable_event(event):
+    """Returns an event without references to the linted buffer and its
+    tokens, or None if it doesn't need to be kept. Only problems and yamllint
+    directives are kept: other comments are only used by comment rules, which
+    already ran."""
+    line_no, problems, comment = event
+    if comment is not None:
+        text = str(comment)
+        if text.startswith('# yamllint'):
+            # The beginning of the line is kept to tell inline comments apart
+            line_start = comment.buffer.rfind('\n', 0, comment.pointer) + 1
+            prefix = comment.buffer[line_start:comment.pointer]
+            comment = parser.LineComment(comment.line_no, comment.column_no,
+                                         prefix + text, len(prefix))
+        else:
+            comment = None
+    if problems or comment is not None:
+        return line_no, problems, comment
+
+
+def get_document_events(buffer, conf, filepath, memo, rules=None):
+    """Runs token and comment rules on each document of a stream separately.
+
+    Results of documents already linted with the same rules and the same state
+    carried over from previous documents are taken from `memo` (a dict, that
+    can be shared between runs with the same configuration).
+
+    Returns a list of events (like get_token_and_comment_events()), or None if
+    the stream cannot be linted document by document.
+    """
+    if not isinstance(buffer, str) or DIRECTIVE_PATTERN.search(buffer):
+        return None
+
+    chunks = split_documents(buffer)
+    if len(chunks) < 2:
+        return None
+
+    if rules is None:
+        rules = conf.enabled_rules(filepath, buffer)
+    token_rules = [r for r in rules if r.TYPE == 'token']
+    comment_rules = [r for r in rules if r.TYPE == 'comment']
+
+    # Tokens are not kept in memoized results
+    if needs_line_tokens(conf, [r for r in rules if r.TYPE == 'line']):
+        return None
+
+    carried = {}
+    for rule in token_rules:
+        if hasattr(rule, 'DOCUMENT_STATE'):
+            keys = rule.DOCUMENT_STATE(conf.rules[rule.ID])
+            if keys is None:
+                return None
+            carried[rule.ID] = keys
+
+    rule_ids = tuple(r.ID for r in token_rules + comment_rules)
+    state = {id: {} for id in carried}
+    events = []
+    for line_offset, chunk in chunks:
+        digest = hashlib.blake2b(chunk.encode('utf-8', 'surrogatepass'))
+        key = (digest.digest(),
+               rule_ids,
+               tuple(tuple(sorted(state[id].items())) for id in carried))
+
+        if key not in memo:
+            if get_syntax_error(chunk):
+                memo[key] = None
             else:
-                disabled_for_next_line.process_comment(elem)
-        elif isinstance(elem, parser.Line):
-            for rule in line_rules:
-                rule_conf = conf.rules[rule.ID]
-                for problem in rule.check(rule_conf, elem):
-                    problem.rule = rule.ID
-                    problem.level = rule_conf['level']
-                    cache.append(problem)
+                context = {rule.ID: dict(state.get(rule.ID, {}))
+                           for rule in token_rules}
+                chunk_events = get_token_and_comment_events(
+                    chunk, conf, token_rules, comment_rules, context)
+                chunk_events = [event for event in map(memoizable_event,
+                                                       chunk_events)
+                                if event is not None]
+                exit_state = {id: {k: context[id][k] for k in keys
+                                   if k in context[id]}
+                              for id, keys in carried.items()}
+                memo[key] = chunk_events, exit_state
+
+        if memo[key] is None:
+            return None
+        chunk_events, state = memo[key]
+
+        for line_no, problems, comment in chunk_events:
+            if line_offset:
+                problems = [problem.shifted(line_offset)
+                            for problem in problems]
+            events.append((line_no + line_offset, problems, comment))
+
+    return events
+
+
+def get_json_events(buffer, conf, rules):
+    """Checks a JSON source with the json module, which is much faster than
+    the YAML scanner.
+
+    Returns events like get_token_and_comment_events(), or None if the source
+    isn't valid JSON. Token rules are not run, except key-duplicates when some
+    keys are duplicated.
+    """
+    duplicates = False
 
-            # This is the last token/comment/line of this line, let's flush the
-            # problems found (but filter them according to the directives)
-            for problem in cache:
-                if not (disabled_for_line.is_disabled_by_directive(problem) or
-                        disabled.is_disabled_by_directive(problem)):
-                    yield problem
+    def object_pairs_hook(pairs):
+        nonlocal duplicates
+        if len({key for key, _value in pairs}) < len(pairs):
+            duplicates = True
 
-            disabled_for_line = disabled_for_next_line
-            disabled_for_next_line = DisableLineDirective()
-            cache = []
+    try:
+        json.loads(buffer, object_pairs_hook=object_pairs_hook)
+    except (ValueError, RecursionError):
+        return None
 
+    key_duplicates = [rule for rule in rules if rule.ID == 'key-duplicates']
+    if duplicates and key_duplicates:
+        # Rare enough to afford scanning tokens, to locate the duplicates
+        return get_token_and_comment_events(buffer, conf, key_duplicates, [])
+    return iter(())
 
-def get_syntax_error(buffer):
+
+def get_syntax_error(buffer, loader=yaml.BaseLoader):
     try:
-        list(yaml.parse(buffer, Loader=yaml.BaseLoader))
+        list(yaml.parse(buffer, Loader=loader))
     except yaml.error.MarkedYAMLError as e:
         problem = LintProblem(e.problem_mark.line + 1,
                               e.problem_mark.column + 1,
@@ -184,7 +465,47 @@ def get_syntax_error(buffer):
         return problem
 
 
-def _run(buffer, conf, filepath):
+def get_file_size_problem(filepath, conf):
+    """Returns a problem if the file is bigger than the ``max-file-size``
+    setting, without opening it."""
+    if conf.max_file_size is None or conf.is_file_ignored(filepath):
+        return None
+
+    size = os.stat(filepath).st_size
+    if size > conf.max_file_size:
+        problem = LintProblem(1, 1, f'file too big: {size} > '
+                                    f'{conf.max_file_size} bytes '
+                                    f'(max-file-size)')
+        problem.level = 'error'
+        return problem
+
+
+def check_syntax(input):
+    """Only checks that a YAML source can be parsed, using libyaml if
+    available, which is much faster than linting it.
+
+    Returns a list with the syntax error found, if any. Error messages may
+    differ from :func:`run`'s when libyaml is used.
+
+    :param input: buffer, string or stream to read from (bytes are decoded
+                  as UTF-8)
+    """
+    if isinstance(input, io.IOBase):
+        input = input.read()
+    elif not isinstance(input, (bytes, str)):
+        raise TypeError('input should be a string or a stream')
+    if isinstance(input, bytes):
+        input = input.decode('utf-8')
+
+    first_line = next(parser.line_generator(input)).content
+    if re.match(r'^#\s*yamllint disable-file\s*$', first_line):
+        return []
+
+    syntax_error = get_syntax_error(input, FAST_LOADER)
+    return [] if syntax_error is None else [syntax_error]
+
+
+def _run(buffer, conf, filepath, documents_memo=None):
     assert hasattr(buffer, '__getitem__'), \
         '_run() argument must be a buffer, not a stream'
 
@@ -192,20 +513,58 @@ def _run(buffer, conf, filepath):
     if re.match(r'^#\s*yamllint disable-file\s*$', first_line):
         return
 
+    # Rules that can't report anything on this buffer are left out
+    rules = conf.enabled_rules(filepath, buffer)
+    if (conf.fast_json and isinstance(buffer, str) and
+            JSON_START_PATTERN.match(buffer)):
+        # JSON sources are checked without the YAML scanner, unless they turn
+        # out not to be JSON
+        events = get_json_events(buffer, conf, rules)
+        if events is not None:
+            yield from get_cosmetic_problems(buffer, conf, filepath, events,
+                                             rules)
+            return
+
+    if (not conf.check_syntax and
+            all(rule.TYPE == 'line' for rule in rules) and
+            not needs_line_tokens(conf, rules)):
+        # Only lines need to be looked at: don't run the YAML scanner at all,
+        # only look for yamllint directives
+        events = ((comment.line_no, [], comment)
+                  for comment in parser.directive_comment_generator(buffer))
+        yield from get_cosmetic_problems(buffer, conf, filepath, events,
+                                         rules)
+        return
+
+    # Multi-document streams are linted document by document, so that
+    # repeated documents are only linted once. This is only possible without
+    # syntax errors.
+    events = get_document_events(
+        buffer, conf, filepath,
+        {} if documents_memo is None else documents_memo, rules)
+    if events is not None:
+        events = iter(events)
+
     # If the document contains a syntax error, save it and yield it at the
     # right line
-    syntax_error = get_syntax_error(buffer)
+    syntax_error = (get_syntax_error(buffer)
+                    if events is None and conf.check_syntax else None)
+    error_position = None
 
-    for problem in get_cosmetic_problems(buffer, conf, filepath):
+    for problem in get_cosmetic_problems(buffer, conf, filepath, events,
+                                         rules):
         # Insert the syntax error (if any) at the right place...
         if (syntax_error and syntax_error.line <= problem.line and
                 syntax_error.column <= problem.column):
             yield syntax_error
-
-            # Discard the problem since it is at the same place as the syntax
-            # error and is probably redundant (and maybe it's just a 'warning',
-            # in which case the script won't even exit with a failure status).
+            error_position = (syntax_error.line, syntax_error.column)
             syntax_error = None
+
+        # Discard problems at the same place as the syntax error: they are
+        # probably redundant (and maybe just warnings, in which case the script
+        # won't even exit with a failure status). All of them are discarded,
+        # so that what is shown doesn't depend on which rules are enabled.
+        if (problem.line, problem.column) == error_position:
             continue
 
         yield problem
@@ -233,3 +592,74 @@ def run(input, conf, filepath=None):
         return _run(content, conf, filepath)
     else:
         raise TypeError('input should be a string or a stream')
+
+
+class LRUCache(collections.OrderedDict):
+    """Dict keeping at most `maxsize` entries: the least recently read or
+    written ones are dropped first."""
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class BatchRunner:
+    """Lints several sources with the same configuration.
+
+    Sources with identical contents and the same enabled rules are only linted
+    once: their problems are reused. Results are kept for the `cache_size`
+    most recently seen sources (and as many documents), so that memory use
+    doesn't grow with the number of sources.
+    """
+    def __init__(self, conf, max_problems=None, cache_size=1024):
+        self.conf = conf
+        #: Maximum number of problems reported per source (without limit if
+        #: None)
+        self.max_problems = max_problems
+        #: Number of sources actually linted
+        self.linted = 0
+        #: Number of sources whose problems were reused from a previous one
+        self.saved = 0
+        self._problems = LRUCache(cache_size)
+        self._documents = LRUCache(cache_size)
+
+    def run(self, input, filepath=None):
+        """Lints a YAML source, like :func:`run`.
+
+        Returns a list of LintProblem objects.
+        """
+        if filepath is not None and self.conf.is_file_ignored(filepath):
+            return []
+
+        if isinstance(input, io.IOBase):
+            input = input.read()
+        elif not isinstance(input, (bytes, str)):
+            raise TypeError('input should be a string or a stream')
+
+        digest = hashlib.blake2b(
+            input if isinstance(input, bytes)
+            else input.encode('utf-8', 'surrogatepass')).digest()
+        key = (isinstance(input, bytes), digest,
+               tuple(rule.ID for rule in self.conf.enabled_rules(filepath)))
+
+        if key in self._problems:
+            self.saved += 1
+            return self._problems[key]
+
+        self.linted += 1
+        problems = _run(input, self.conf, filepath, self._documents)
+        if self.max_problems is not None:
+            problems = limit_problems(problems, self.max_problems)
+        problems = list(problems)
+        self._problems[key] = problems
+        return problems
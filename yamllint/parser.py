@@ -22,6 +22,9 @@ class Line:
         self.start = start
         self.end = end
         self.buffer = buffer
+        # Tokens starting on this line, only given to line rules that ask for
+        # them (see LINE_TOKENS in yamllint.linter)
+        self.tokens = None
 
     @property
     def content(self):
@@ -71,6 +74,100 @@ class Comment:
         )
 
 
+MAPPING, SEQUENCE = range(2)
+
+
+class Node:
+    def __init__(self, kind, flow):
+        self.kind = kind
+        self.flow = flow
+        # Scalar keys seen so far, when this node is a mapping
+        self.keys = set()
+        # Free storage for rules that need per-node data, keyed by rule ID
+        self.state = {}
+
+
+class Structure:
+    """Structural context of the token stream, shared by all token rules.
+
+    It is updated by the linter before token rules are run on each token, and
+    is available to them as ``context['structure']``:
+
+    - ``stack``: the mappings and sequences (``Node`` objects) containing the
+      current token, the innermost last,
+    - ``node``: the innermost one, or ``None``,
+    - ``flow_depth``: the number of flow collections containing the token,
+    - ``document_index``: the index of the current document in the linted
+      buffer (starting at 0),
+    - ``key``: on a ``KeyToken`` introducing a scalar key in a mapping, the
+      value of this key (``None`` otherwise),
+    - ``facts``: a dict where rules store what they computed about the
+      current token, for other rules to reuse it (see
+      ``yamllint.rules.common.scalar_info()``). It is emptied on each token.
+
+    ``node.keys`` only contains the keys that come *before* the current
+    ``key``, so that rules can tell whether it was already seen.
+    """
+    def __init__(self):
+        self.stack = []
+        self.flow_depth = 0
+        self.document_index = -1
+        self.key = None
+        self.facts = {}
+        self._in_document = False
+
+    @property
+    def node(self):
+        return self.stack[-1] if self.stack else None
+
+    def update(self, token, next):
+        if self.facts:
+            self.facts = {}
+
+        if self.key is not None:
+            self.stack[-1].keys.add(self.key)
+            self.key = None
+
+        if isinstance(token, (yaml.StreamStartToken, yaml.StreamEndToken,
+                              yaml.DirectiveToken)):
+            return
+        elif isinstance(token, yaml.DocumentEndToken):
+            self._in_document = False
+            return
+        elif (isinstance(token, yaml.DocumentStartToken) or
+                not self._in_document):
+            self.document_index += 1
+            self._in_document = True
+
+        if isinstance(token, yaml.BlockMappingStartToken):
+            self.stack.append(Node(MAPPING, False))
+        elif isinstance(token, yaml.BlockSequenceStartToken):
+            self.stack.append(Node(SEQUENCE, False))
+        elif isinstance(token, yaml.FlowMappingStartToken):
+            self.stack.append(Node(MAPPING, True))
+            self.flow_depth += 1
+        elif isinstance(token, yaml.FlowSequenceStartToken):
+            self.stack.append(Node(SEQUENCE, True))
+            self.flow_depth += 1
+        elif isinstance(token, (yaml.BlockEndToken,
+                                yaml.FlowMappingEndToken,
+                                yaml.FlowSequenceEndToken)):
+            if self.stack and self.stack.pop().flow:
+                self.flow_depth -= 1
+        elif (isinstance(token, yaml.KeyToken) and
+              isinstance(next, yaml.ScalarToken)):
+            # KeyTokens can also be found inside flow sequences, e.g. [a: 1]
+            if self.stack and self.stack[-1].kind == MAPPING:
+                self.key = next.value
+
+
+class LineComment(Comment):
+    """A comment found without scanning tokens, by looking at a line alone"""
+    def is_inline(self):
+        line_start = self.buffer.rfind('\n', 0, self.pointer) + 1
+        return self.buffer[line_start:self.pointer].strip() != ''
+
+
 def line_generator(buffer):
     line_no = 1
     cur = 0
@@ -89,34 +186,70 @@ def line_generator(buffer):
 
 def comments_between_tokens(token1, token2):
     """Find all comments between two tokens"""
+    buffer = token1.end_mark.buffer
     if token2 is None:
-        buf = token1.end_mark.buffer[token1.end_mark.pointer:]
+        end = len(buffer)
     elif (token1.end_mark.line == token2.start_mark.line and
           not isinstance(token1, yaml.StreamStartToken) and
           not isinstance(token2, yaml.StreamEndToken)):
         return
     else:
-        buf = token1.end_mark.buffer[token1.end_mark.pointer:
-                                     token2.start_mark.pointer]
+        end = token2.start_mark.pointer
 
-    line_no = token1.end_mark.line + 1
-    column_no = token1.end_mark.column + 1
+    # Look for '#' directly in the buffer, without copying the gap
     pointer = token1.end_mark.pointer
+    pos = buffer.find('#', pointer, end)
+    if pos == -1:
+        return
+
+    line_no = token1.end_mark.line + 1
+    line_start = pointer - token1.end_mark.column
 
     comment_before = None
-    for line in buf.split('\n'):
-        pos = line.find('#')
-        if pos != -1:
-            comment = Comment(line_no, column_no + pos,
-                              token1.end_mark.buffer, pointer + pos,
-                              token1, token2, comment_before)
-            yield comment
+    while pos != -1:
+        breaks = buffer.count('\n', pointer, pos)
+        if breaks:
+            line_no += breaks
+            line_start = buffer.rfind('\n', pointer, pos) + 1
 
-            comment_before = comment
+        comment = Comment(line_no, pos - line_start + 1, buffer, pos,
+                          token1, token2, comment_before)
+        yield comment
 
-        pointer += len(line) + 1
-        line_no += 1
-        column_no = 1
+        comment_before = comment
+
+        # Only the first '#' of each line starts a comment
+        pointer = buffer.find('\n', pos, end)
+        if pointer == -1:
+            break
+        pos = buffer.find('#', pointer, end)
+
+
+def directive_comment_generator(buffer):
+    """Find yamllint directives without scanning tokens.
+
+    A comment starts at the first '#' of a line that is at the beginning of
+    the line or preceded by a space or tab. As strings are not parsed, a '#'
+    inside a quoted string can be mistaken for the start of a comment.
+    """
+    line_no, counted = 1, 0
+    pos = buffer.find('# yamllint')
+    while pos != -1:
+        line_start = buffer.rfind('\n', 0, pos) + 1
+        line_no += buffer.count('\n', counted, line_start)
+        counted = line_start
+
+        start = buffer.find('#', line_start, pos + 1)
+        while (start not in (-1, line_start) and
+               buffer[start - 1] not in ' \t'):
+            start = buffer.find('#', start + 1, pos + 1)
+        if start == pos:
+            yield LineComment(line_no, pos - line_start + 1, buffer, pos)
+
+        line_end = buffer.find('\n', pos)
+        if line_end == -1:
+            break
+        pos = buffer.find('# yamllint', line_end)
 
 
 def token_or_comment_generator(buffer):
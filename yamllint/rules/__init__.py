@@ -14,6 +14,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from yamllint.rules import (
+    alias_expansion,
     anchors,
     braces,
     brackets,
@@ -21,6 +22,7 @@ from yamllint.rules import (
     commas,
     comments,
     comments_indentation,
+    document_complexity,
     document_end,
     document_start,
     empty_lines,
@@ -35,11 +37,13 @@ from yamllint.rules import (
     new_lines,
     octal_values,
     quoted_strings,
+    scalar_size,
     trailing_spaces,
     truthy,
 )
 
 _RULES = {
+    alias_expansion.ID: alias_expansion,
     anchors.ID: anchors,
     braces.ID: braces,
     brackets.ID: brackets,
@@ -47,6 +51,7 @@ _RULES = {
     commas.ID: commas,
     comments.ID: comments,
     comments_indentation.ID: comments_indentation,
+    document_complexity.ID: document_complexity,
     document_end.ID: document_end,
     document_start.ID: document_start,
     empty_lines.ID: empty_lines,
@@ -61,6 +66,7 @@ _RULES = {
     new_lines.ID: new_lines,
     octal_values.ID: octal_values,
     quoted_strings.ID: quoted_strings,
+    scalar_size.ID: scalar_size,
     trailing_spaces.ID: trailing_spaces,
     truthy.ID: truthy,
 }
@@ -0,0 +1,231 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Use this rule to limit how much a document grows when its aliases are
+expanded. Aliases referencing anchors that themselves contain aliases make the
+loaded data grow exponentially (as in the "billion laughs" attack), and long
+chains of merge keys (``<<``) are hard to follow.
+
+The size of each anchored node is computed once, when the node ends, so
+documents are checked in a single pass over their tokens, without expanding
+anything.
+
+.. rubric:: Options
+
+* ``max-expanded-nodes`` is the maximum number of nodes (scalars, mappings and
+  sequences) that a document may contain once all its aliases are expanded.
+  The document is reported on the alias that makes it exceed this number.
+  Aliases referencing an anchor from inside the anchored node (recursive
+  aliases) are always reported.
+* ``max-merge-depth`` is the maximum length of a chain of merge keys, e.g. a
+  mapping merging an anchor that itself merges another anchor is a chain of
+  length 2.
+
+.. rubric:: Default values (when enabled)
+
+.. code-block:: yaml
+
+ rules:
+   alias-expansion:
+     max-expanded-nodes: 100000
+     max-merge-depth: 5
+
+.. rubric:: Examples
+
+#. With ``alias-expansion: {max-expanded-nodes: 20}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    ---
+    - &a [x, x, x]
+    - [*a, *a, *a]
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    - &a [x, x, x]
+    - &b [*a, *a, *a]
+    - [*b, *b, *b]
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    &a [x, *a]
+
+#. With ``alias-expansion: {max-merge-depth: 1}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    ---
+    base: &base
+      foo: bar
+    child:
+      <<: *base
+      extra: value
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    base: &base
+      foo: bar
+    child: &child
+      <<: *base
+      extra: value
+    grandchild:
+      <<: *child
+"""
+
+
+import yaml
+
+from yamllint.linter import LintProblem
+
+ID = 'alias-expansion'
+TYPE = 'token'
+CONF = {'max-expanded-nodes': int,
+        'max-merge-depth': int}
+DEFAULT = {'max-expanded-nodes': 100000,
+           'max-merge-depth': 5}
+
+
+def VALIDATE(conf):
+    for option in ('max-expanded-nodes', 'max-merge-depth'):
+        if conf[option] < 0:
+            return f'"{option}" should be a non-negative number'
+
+
+class Anchored:
+    """A node carrying an anchor, whose end hasn't been reached yet"""
+    def __init__(self, name, depth, indentless, start):
+        self.name = name
+        # Number of mappings and sequences containing the node's content
+        self.depth = depth
+        # Sequences like "key: &anchor\n- item" have no start and end tokens
+        self.indentless = indentless
+        self.start = start
+        self.merge_depth = 0
+
+    def ends_on(self, token, depth):
+        if depth < self.depth:
+            return True
+        return (self.indentless and depth == self.depth and
+                isinstance(token, yaml.KeyToken))
+
+
+COLLECTION_START = (yaml.BlockMappingStartToken,
+                    yaml.BlockSequenceStartToken,
+                    yaml.FlowMappingStartToken,
+                    yaml.FlowSequenceStartToken)
+
+
+def enter(context, anchored):
+    context['open'].append(anchored)
+    names = context['open_names']
+    names[anchored.name] = names.get(anchored.name, 0) + 1
+
+
+def leave(context):
+    anchored = context['open'].pop()
+    context['open_names'][anchored.name] -= 1
+    context['sizes'][anchored.name] = context['nodes'] - anchored.start
+    context['merge_depths'][anchored.name] = anchored.merge_depth
+    if context['open']:
+        parent = context['open'][-1]
+        parent.merge_depth = max(parent.merge_depth, anchored.merge_depth)
+
+
+def check(conf, token, prev, next, nextnext, context):
+    structure = context['structure']
+    depth = len(structure.stack)
+
+    if context.get('document') != structure.document_index:
+        context['document'] = structure.document_index
+        context['nodes'] = 0
+        context['sizes'] = {}
+        context['merge_depths'] = {}
+        context['open'] = []  # anchored nodes containing the current token
+        context['open_names'] = {}
+        context['pending'] = None  # anchor waiting for its node
+        context['merge'] = None  # depth of the value of a merge key
+        context['reported'] = False
+
+    while context['open'] and context['open'][-1].ends_on(token, depth):
+        leave(context)
+
+    pending = context['pending']
+    if pending is not None and not isinstance(token, yaml.TagToken):
+        context['pending'] = None
+        if isinstance(token, COLLECTION_START):
+            # The collection itself is counted below
+            enter(context, Anchored(pending, depth, False, context['nodes']))
+        elif isinstance(token, yaml.BlockEntryToken):
+            enter(context, Anchored(pending, depth, True, context['nodes']))
+        else:
+            # A scalar (counted below) or an empty node
+            context['sizes'][pending] = 1
+            context['merge_depths'][pending] = 0
+            if not isinstance(token, yaml.ScalarToken):
+                context['nodes'] += 1
+
+    if isinstance(token, yaml.AnchorToken):
+        context['pending'] = token.value
+    elif isinstance(token, (yaml.ScalarToken,) + COLLECTION_START):
+        context['nodes'] += 1
+    elif (isinstance(token, yaml.AliasToken) and
+            context['open_names'].get(token.value)):
+        yield LintProblem(
+            token.start_mark.line + 1, token.start_mark.column + 1,
+            f'found recursive alias "{token.value}"')
+    elif isinstance(token, yaml.AliasToken):
+        context['nodes'] += context['sizes'].get(token.value, 1)
+        if (not context['reported'] and
+                context['nodes'] > conf['max-expanded-nodes']):
+            context['reported'] = True
+            yield LintProblem(
+                token.start_mark.line + 1, token.start_mark.column + 1,
+                f'too many nodes after expanding aliases '
+                f'(> {conf["max-expanded-nodes"]})')
+
+        if context['merge'] is not None:
+            merge_depth = 1 + context['merge_depths'].get(token.value, 0)
+            if context['open']:
+                anchored = context['open'][-1]
+                anchored.merge_depth = max(anchored.merge_depth, merge_depth)
+            if merge_depth > conf['max-merge-depth']:
+                yield LintProblem(
+                    token.start_mark.line + 1, token.start_mark.column + 1,
+                    f'too many nested merge keys '
+                    f'({merge_depth} > {conf["max-merge-depth"]})')
+
+    # Aliases merged with "<<: *alias" or "<<: [*alias1, *alias2]"
+    if (isinstance(token, yaml.ValueToken) and
+            isinstance(prev, yaml.ScalarToken) and
+            prev.plain and prev.value == '<<'):
+        context['merge'] = depth
+    elif context['merge'] is not None:
+        if isinstance(token, yaml.FlowSequenceStartToken):
+            if depth != context['merge'] + 1:
+                context['merge'] = None
+        elif isinstance(token, yaml.AliasToken):
+            if depth == context['merge']:
+                context['merge'] = None
+        elif not isinstance(token, yaml.FlowEntryToken):
+            context['merge'] = None
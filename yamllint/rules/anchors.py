@@ -104,6 +104,8 @@ anchors.
 """
 
 
+import re
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -118,6 +120,10 @@ DEFAULT = {'forbid-undeclared-aliases': True,
            'forbid-unused-anchors': False}
 
 
+def PREFILTER(conf):
+    return re.compile(r'[&*]')
+
+
 def check(conf, token, prev, next, nextnext, context):
     if (conf['forbid-undeclared-aliases'] or
             conf['forbid-duplicated-anchors'] or
@@ -132,6 +132,8 @@ braces (``{`` and ``}``).
 """
 
 
+import re
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -151,6 +153,10 @@ DEFAULT = {'forbid': False,
            'max-spaces-inside-empty': -1}
 
 
+def PREFILTER(conf):
+    return re.compile(r'\{')
+
+
 def check(conf, token, prev, next, nextnext, context):
     if (conf['forbid'] is True and
             isinstance(token, yaml.FlowMappingStartToken)):
@@ -175,7 +181,8 @@ def check(conf, token, prev, next, nextnext, context):
                                     if conf['max-spaces-inside-empty'] != -1
                                     else conf['max-spaces-inside']),
                                min_desc='too few spaces inside empty braces',
-                               max_desc='too many spaces inside empty braces')
+                               max_desc='too many spaces inside empty braces',
+                               context=context)
         if problem is not None:
             yield problem
 
@@ -184,7 +191,8 @@ def check(conf, token, prev, next, nextnext, context):
                                min=conf['min-spaces-inside'],
                                max=conf['max-spaces-inside'],
                                min_desc='too few spaces inside braces',
-                               max_desc='too many spaces inside braces')
+                               max_desc='too many spaces inside braces',
+                               context=context)
         if problem is not None:
             yield problem
 
@@ -195,6 +203,7 @@ def check(conf, token, prev, next, nextnext, context):
                                 min=conf['min-spaces-inside'],
                                 max=conf['max-spaces-inside'],
                                 min_desc='too few spaces inside braces',
-                                max_desc='too many spaces inside braces')
+                                max_desc='too many spaces inside braces',
+                                context=context)
         if problem is not None:
             yield problem
@@ -133,6 +133,8 @@ inside brackets (``[`` and ``]``).
 """
 
 
+import re
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -152,6 +154,10 @@ DEFAULT = {'forbid': False,
            'max-spaces-inside-empty': -1}
 
 
+def PREFILTER(conf):
+    return re.compile(r'\[')
+
+
 def check(conf, token, prev, next, nextnext, context):
     if (conf['forbid'] is True and
             isinstance(token, yaml.FlowSequenceStartToken)):
@@ -177,7 +183,8 @@ def check(conf, token, prev, next, nextnext, context):
                                     else conf['max-spaces-inside']),
                                min_desc='too few spaces inside empty brackets',
                                max_desc=('too many spaces inside empty '
-                                         'brackets'))
+                                         'brackets'),
+                               context=context)
         if problem is not None:
             yield problem
 
@@ -186,7 +193,8 @@ def check(conf, token, prev, next, nextnext, context):
                                min=conf['min-spaces-inside'],
                                max=conf['max-spaces-inside'],
                                min_desc='too few spaces inside brackets',
-                               max_desc='too many spaces inside brackets')
+                               max_desc='too many spaces inside brackets',
+                               context=context)
         if problem is not None:
             yield problem
 
@@ -197,6 +205,7 @@ def check(conf, token, prev, next, nextnext, context):
                                 min=conf['min-spaces-inside'],
                                 max=conf['max-spaces-inside'],
                                 min_desc='too few spaces inside brackets',
-                                max_desc='too many spaces inside brackets')
+                                max_desc='too many spaces inside brackets',
+                                context=context)
         if problem is not None:
             yield problem
@@ -96,19 +96,22 @@ def check(conf, token, prev, next, nextnext, context):
             token.start_mark.pointer - prev.end_mark.pointer == 1):
         problem = spaces_before(token, prev, next,
                                 max=conf['max-spaces-before'],
-                                max_desc='too many spaces before colon')
+                                max_desc='too many spaces before colon',
+                                context=context)
         if problem is not None:
             yield problem
 
         problem = spaces_after(token, prev, next,
                                max=conf['max-spaces-after'],
-                               max_desc='too many spaces after colon')
+                               max_desc='too many spaces after colon',
+                               context=context)
         if problem is not None:
             yield problem
 
     if isinstance(token, yaml.KeyToken) and is_explicit_key(token):
         problem = spaces_after(token, prev, next,
                                max=conf['max-spaces-after'],
-                               max_desc='too many spaces after question mark')
+                               max_desc='too many spaces after question mark',
+                               context=context)
         if problem is not None:
             yield problem
@@ -126,7 +126,8 @@ def check(conf, token, prev, next, nextnext, context):
         else:
             problem = spaces_before(token, prev, next,
                                     max=conf['max-spaces-before'],
-                                    max_desc='too many spaces before comma')
+                                    max_desc='too many spaces before comma',
+                                    context=context)
             if problem is not None:
                 yield problem
 
@@ -134,6 +135,7 @@ def check(conf, token, prev, next, nextnext, context):
                                min=conf['min-spaces-after'],
                                max=conf['max-spaces-after'],
                                min_desc='too few spaces after comma',
-                               max_desc='too many spaces after comma')
+                               max_desc='too many spaces after comma',
+                               context=context)
         if problem is not None:
             yield problem
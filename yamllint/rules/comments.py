@@ -73,6 +73,8 @@ Use this rule to control the position and formatting of comments.
 """
 
 
+import re
+
 from yamllint.linter import LintProblem
 
 ID = 'comments'
@@ -85,6 +87,10 @@ DEFAULT = {'require-starting-space': True,
            'min-spaces-from-content': 2}
 
 
+def PREFILTER(conf):
+    return re.compile(r'#')
+
+
 def check(conf, comment):
     if (conf['min-spaces-from-content'] != -1 and comment.is_inline() and
             comment.pointer - comment.token_before.end_mark.pointer <
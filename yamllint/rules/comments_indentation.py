@@ -74,6 +74,8 @@ Use this rule to force comments to be indented like content.
 """
 
 
+import re
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -83,6 +85,10 @@ ID = 'comments-indentation'
 TYPE = 'comment'
 
 
+def PREFILTER(conf):
+    return re.compile(r'#')
+
+
 # Case A:
 #
 #     prev: line:
@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+import re
 import string
 
 import yaml
@@ -20,10 +22,50 @@ import yaml
 from yamllint.linter import LintProblem
 
 
+class Spacing:
+    """Spaces around a token, shared by the punctuation spacing rules.
+
+    ``before`` (resp. ``after``) is the number of spaces between the previous
+    token and this one (resp. this one and the next token), or ``None`` if
+    they are not on the same line.
+    """
+    def __init__(self, token, prev, next):
+        self.tokens = token, prev, next
+        self.before = None
+        self.after = None
+
+        if (prev is not None and
+                prev.end_mark.line == token.start_mark.line and
+                # Discard tokens (only scalars?) that end at the start of next
+                # line
+                (prev.end_mark.pointer == 0 or
+                 prev.end_mark.buffer[prev.end_mark.pointer - 1] != '\n')):
+            self.before = token.start_mark.pointer - prev.end_mark.pointer
+
+        if next is not None and token.end_mark.line == next.start_mark.line:
+            self.after = next.start_mark.pointer - token.end_mark.pointer
+
+
+def spacing(token, prev, next, context=None):
+    """Returns the :class:`Spacing` around a token.
+
+    If the rule's `context` is given, it is computed once for the current
+    token and shared by all rules, like :func:`scalar_info`.
+    """
+    if context is None:
+        return Spacing(token, prev, next)
+    facts = context['structure'].facts
+    spaces = facts.get('spacing')
+    if (spaces is None or spaces.tokens[0] is not token or
+            spaces.tokens[1] is not prev or spaces.tokens[2] is not next):
+        spaces = facts['spacing'] = Spacing(token, prev, next)
+    return spaces
+
+
 def spaces_after(token, prev, next, min=-1, max=-1,
-                 min_desc=None, max_desc=None):
-    if next is not None and token.end_mark.line == next.start_mark.line:
-        spaces = next.start_mark.pointer - token.end_mark.pointer
+                 min_desc=None, max_desc=None, context=None):
+    spaces = spacing(token, prev, next, context).after
+    if spaces is not None:
         if max != - 1 and spaces > max:
             return LintProblem(token.start_mark.line + 1,
                                next.start_mark.column, max_desc)
@@ -33,12 +75,9 @@ def spaces_after(token, prev, next, min=-1, max=-1,
 
 
 def spaces_before(token, prev, next, min=-1, max=-1,
-                  min_desc=None, max_desc=None):
-    if (prev is not None and prev.end_mark.line == token.start_mark.line and
-            # Discard tokens (only scalars?) that end at the start of next line
-            (prev.end_mark.pointer == 0 or
-             prev.end_mark.buffer[prev.end_mark.pointer - 1] != '\n')):
-        spaces = token.start_mark.pointer - prev.end_mark.pointer
+                  min_desc=None, max_desc=None, context=None):
+    spaces = spacing(token, prev, next, context).before
+    if spaces is not None:
         if max != - 1 and spaces > max:
             return LintProblem(token.start_mark.line + 1,
                                token.start_mark.column, max_desc)
@@ -86,3 +125,126 @@ def is_explicit_key(token):
     #   : v
     return (token.start_mark.pointer < token.end_mark.pointer and
             token.start_mark.buffer[token.start_mark.pointer] == '?')
+
+
+IS_NUMERAL_BEFORE_DECIMAL_PATTERN = (
+    re.compile(r'[-+]?(\.[0-9]+)([eE][-+]?[0-9]+)?$')
+)
+IS_SCIENTIFIC_NOTATION_PATTERN = re.compile(
+    r'[-+]?(\.[0-9]+|[0-9]+(\.[0-9]*)?)([eE][-+]?[0-9]+)$'
+)
+IS_INF_PATTERN = re.compile(r'[-+]?(\.inf|\.Inf|\.INF)$')
+IS_NAN_PATTERN = re.compile(r'(\.nan|\.NaN|\.NAN)$')
+IS_OCTAL_NUMBER_PATTERN = re.compile(r'^[0-7]+$')
+
+_resolver = yaml.resolver.Resolver()
+
+
+class ScalarInfo:
+    """Classification of a scalar token.
+
+    Each fact is computed on first request only, and then shared by all the
+    rules that inspect the same token (see :func:`scalar_info`).
+    """
+    def __init__(self, token):
+        self.token = token
+
+    @functools.cached_property
+    def implicit_tag(self):
+        """Tag the value would resolve to, if it was written plain."""
+        return _resolver.resolve(yaml.nodes.ScalarNode, self.token.value,
+                                 (True, False))
+
+    @functools.cached_property
+    def is_nan(self):
+        return IS_NAN_PATTERN.match(self.token.value) is not None
+
+    @functools.cached_property
+    def is_inf(self):
+        return IS_INF_PATTERN.match(self.token.value) is not None
+
+    @functools.cached_property
+    def is_scientific_notation(self):
+        return (IS_SCIENTIFIC_NOTATION_PATTERN.match(self.token.value)
+                is not None)
+
+    @functools.cached_property
+    def lacks_numeral_before_decimal(self):
+        return (IS_NUMERAL_BEFORE_DECIMAL_PATTERN.match(self.token.value)
+                is not None)
+
+    @functools.cached_property
+    def is_implicit_octal(self):
+        val = self.token.value
+        return (val.isdigit() and len(val) > 1 and val[0] == '0' and
+                IS_OCTAL_NUMBER_PATTERN.match(val[1:]) is not None)
+
+    @functools.cached_property
+    def is_explicit_octal(self):
+        val = self.token.value
+        return (len(val) > 2 and val[:2] == '0o' and
+                IS_OCTAL_NUMBER_PATTERN.match(val[2:]) is not None)
+
+    def quotes_are_needed(self, is_inside_a_flow):
+        """Whether the value could not be written without quotes."""
+        return quotes_are_needed(self.token.value, self.token.style,
+                                 is_inside_a_flow)
+
+
+def scalar_info(token, context=None):
+    """Returns the :class:`ScalarInfo` of a scalar token.
+
+    If the rule's `context` is given, the object is stored with the facts
+    about the current token in ``context['structure']``, so that the other
+    rules inspecting this token get the same one.
+    """
+    if context is None:
+        return ScalarInfo(token)
+    facts = context['structure'].facts
+    info = facts.get('scalar')
+    if info is None or info.token is not token:
+        info = facts['scalar'] = ScalarInfo(token)
+    return info
+
+
+# Characters that can appear anywhere in a plain scalar without ending it or
+# changing its value, apart from flow indicators (":" and "#" excluded)
+_PLAIN_CHARS = ('\x21\x22\x24-\x39\x3B-\x7E\xA1-\u2027\u202A-\uD7FF'
+                '\uE000-\uFEFE\uFF00-\uFFFD\U00010000-\U0010FFFF')
+# Words separated by single spaces, not starting with an indicator
+SIMPLE_PLAIN_SCALAR_PATTERN = re.compile(
+    rf'(?![-?,\[\]{{}}&*!|>\'"%@`])[{_PLAIN_CHARS}]+(?: [{_PLAIN_CHARS}]+)*')
+
+
+@functools.lru_cache(maxsize=4096)
+def quotes_are_needed(string, style, is_inside_a_flow):
+    # Quotes needed on strings containing flow tokens
+    if is_inside_a_flow and set(string) & {',', '[', ']', '{', '}'}:
+        return True
+
+    # Fast path for the common case of simple words and sentences
+    if SIMPLE_PLAIN_SCALAR_PATTERN.fullmatch(string):
+        return False
+
+    if style == '"':
+        try:
+            yaml.reader.Reader('').check_printable('key: ' + string)
+        except yaml.reader.ReaderError:
+            # Special characters in a double-quoted string are assumed to have
+            # been backslash-escaped
+            return True
+
+    loader = yaml.BaseLoader('key: ' + string)
+    # Remove the 5 first tokens corresponding to 'key: ' (StreamStartToken,
+    # BlockMappingStartToken, KeyToken, ScalarToken(value=key), ValueToken)
+    for _ in range(5):
+        loader.get_token()
+    try:
+        a, b = loader.get_token(), loader.get_token()
+    except yaml.scanner.ScannerError:
+        return True
+    else:
+        if (isinstance(a, yaml.ScalarToken) and a.style is None and
+                isinstance(b, yaml.BlockEndToken) and a.value == string):
+            return False
+        return True
@@ -0,0 +1,199 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Use this rule to set a budget on the size and complexity of documents, so that
+payloads that would be expensive to parse or load are caught early.
+
+.. rubric:: Options
+
+* ``max-depth`` is the maximum number of nested mappings and sequences.
+* ``max-nodes`` is the maximum number of nodes (scalars, aliases, mappings and
+  sequences) in a document.
+* ``max-keys`` is the maximum number of keys in a mapping.
+* ``max-flow-items`` is the maximum number of items in a flow sequence or a
+  flow mapping.
+
+Each problem is reported once, on the token that goes over the budget.
+
+.. rubric:: Default values (when enabled)
+
+.. code-block:: yaml
+
+ rules:
+   document-complexity:
+     max-depth: 20
+     max-nodes: 100000
+     max-keys: 1000
+     max-flow-items: 1000
+
+.. rubric:: Examples
+
+#. With ``document-complexity: {max-depth: 2}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    ---
+    key:
+      - item
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    key:
+      - [item]
+
+#. With ``document-complexity: {max-nodes: 7}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    ---
+    a: 1
+    b: [2, 3]
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    a: 1
+    b: [2, 3, 4]
+
+#. With ``document-complexity: {max-keys: 2}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    ---
+    a: 1
+    b: {c: 2, d: 3}
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    a: 1
+    b: 2
+    c: 3
+
+#. With ``document-complexity: {max-flow-items: 3}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    ---
+    - [1, 2, 3]
+    - 4
+    - 5
+    - 6
+
+   the following code snippet would **FAIL**:
+   ::
+
+    ---
+    [1, 2, 3, 4]
+"""
+
+
+import yaml
+
+from yamllint.linter import LintProblem
+from yamllint.parser import MAPPING
+
+ID = 'document-complexity'
+TYPE = 'token'
+CONF = {'max-depth': int,
+        'max-nodes': int,
+        'max-keys': int,
+        'max-flow-items': int}
+DEFAULT = {'max-depth': 20,
+           'max-nodes': 100000,
+           'max-keys': 1000,
+           'max-flow-items': 1000}
+
+
+def VALIDATE(conf):
+    for option in CONF:
+        if conf[option] < 0:
+            return f'"{option}" should be a non-negative number'
+
+
+COLLECTION_START = (yaml.BlockMappingStartToken,
+                    yaml.BlockSequenceStartToken,
+                    yaml.FlowMappingStartToken,
+                    yaml.FlowSequenceStartToken)
+
+
+class Counts:
+    """Keys and items seen so far in a mapping or sequence"""
+    def __init__(self):
+        self.keys = 0
+        self.items = 0
+        # In flow collections, the next token starts a new item
+        self.expect_item = True
+
+
+def check(conf, token, prev, next, nextnext, context):
+    structure = context['structure']
+
+    if context.get('document') != structure.document_index:
+        context['document'] = structure.document_index
+        context['nodes'] = 0
+
+    if isinstance(token, COLLECTION_START):
+        structure.node.state[ID] = Counts()
+        if len(structure.stack) == conf['max-depth'] + 1:
+            yield LintProblem(
+                token.start_mark.line + 1, token.start_mark.column + 1,
+                f'too many nested collections (> {conf["max-depth"]})')
+
+    if isinstance(token, (yaml.ScalarToken, yaml.AliasToken) +
+                  COLLECTION_START):
+        context['nodes'] += 1
+        if context['nodes'] == conf['max-nodes'] + 1:
+            yield LintProblem(
+                token.start_mark.line + 1, token.start_mark.column + 1,
+                f'too many nodes in document (> {conf["max-nodes"]})')
+
+    # The collection directly containing the token (a token starting a
+    # collection is already on the stack, but belongs to its parent)
+    if isinstance(token, COLLECTION_START):
+        parent = structure.stack[-2] if len(structure.stack) > 1 else None
+    else:
+        parent = structure.node
+    if parent is None:
+        return
+    counts = parent.state[ID]
+
+    if isinstance(token, yaml.KeyToken) and parent.kind == MAPPING:
+        counts.keys += 1
+        if counts.keys == conf['max-keys'] + 1:
+            yield LintProblem(
+                token.start_mark.line + 1, token.start_mark.column + 1,
+                f'too many keys in mapping (> {conf["max-keys"]})')
+
+    if parent.flow:
+        if isinstance(token, yaml.FlowEntryToken):
+            counts.expect_item = True
+        elif counts.expect_item:
+            counts.expect_item = False
+            counts.items += 1
+            if counts.items == conf['max-flow-items'] + 1:
+                yield LintProblem(
+                    token.start_mark.line + 1, token.start_mark.column + 1,
+                    f'too many items in flow collection '
+                    f'(> {conf["max-flow-items"]})')
@@ -91,6 +91,11 @@ CONF = {'present': bool}
 DEFAULT = {'present': True}
 
 
+def DOCUMENT_STATE(conf):
+    # A missing document end is reported on the start of the next document
+    return None if conf['present'] else ()
+
+
 def check(conf, token, prev, next, nextnext, context):
     if conf['present']:
         is_stream_end = isinstance(token, yaml.StreamEndToken)
@@ -84,11 +84,10 @@ positive and negative infinity and "not a number".
       angle: .inf
 """
 
-import re
-
 import yaml
 
 from yamllint.linter import LintProblem
+from yamllint.rules.common import scalar_info
 
 ID = 'float-values'
 TYPE = 'token'
@@ -105,15 +104,6 @@ DEFAULT = {
     'forbid-inf': False,
 }
 
-IS_NUMERAL_BEFORE_DECIMAL_PATTERN = (
-    re.compile(r'[-+]?(\.[0-9]+)([eE][-+]?[0-9]+)?$')
-)
-IS_SCIENTIFIC_NOTATION_PATTERN = re.compile(
-    r'[-+]?(\.[0-9]+|[0-9]+(\.[0-9]*)?)([eE][-+]?[0-9]+)$'
-)
-IS_INF_PATTERN = re.compile(r'[-+]?(\.inf|\.Inf|\.INF)$')
-IS_NAN_PATTERN = re.compile(r'(\.nan|\.NaN|\.NAN)$')
-
 
 def check(conf, token, prev, next, nextnext, context):
     if prev and isinstance(prev, yaml.tokens.TagToken):
@@ -122,34 +112,31 @@ def check(conf, token, prev, next, nextnext, context):
         return
     if token.style:
         return
-    val = token.value
+    info = scalar_info(token, context)
 
-    if conf['forbid-nan'] and IS_NAN_PATTERN.match(val):
+    if conf['forbid-nan'] and info.is_nan:
         yield LintProblem(
             token.start_mark.line + 1,
             token.start_mark.column + 1,
             f'forbidden not a number value "{token.value}"',
         )
 
-    if conf['forbid-inf'] and IS_INF_PATTERN.match(val):
+    if conf['forbid-inf'] and info.is_inf:
         yield LintProblem(
             token.start_mark.line + 1,
             token.start_mark.column + 1,
             f'forbidden infinite value "{token.value}"',
         )
 
-    if conf[
-        'forbid-scientific-notation'
-    ] and IS_SCIENTIFIC_NOTATION_PATTERN.match(val):
+    if conf['forbid-scientific-notation'] and info.is_scientific_notation:
         yield LintProblem(
             token.start_mark.line + 1,
             token.start_mark.column + 1,
             f'forbidden scientific notation "{token.value}"',
         )
 
-    if conf[
-        'require-numeral-before-decimal'
-    ] and IS_NUMERAL_BEFORE_DECIMAL_PATTERN.match(val):
+    if (conf['require-numeral-before-decimal'] and
+            info.lacks_numeral_before_decimal):
         yield LintProblem(
             token.start_mark.line + 1,
             token.start_mark.column + 1,
@@ -89,6 +89,7 @@ def check(conf, token, prev, next, nextnext, context):
     if isinstance(token, yaml.BlockEntryToken):
         problem = spaces_after(token, prev, next,
                                max=conf['max-spaces-after'],
-                               max_desc='too many spaces after hyphen')
+                               max_desc='too many spaces after hyphen',
+                               context=context)
         if problem is not None:
             yield problem
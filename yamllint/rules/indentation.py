@@ -199,6 +199,9 @@ Use this rule to control the indentation.
         }
 """
 
+import functools
+import re
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -217,6 +220,11 @@ ROOT, B_MAP, F_MAP, B_SEQ, F_SEQ, B_ENT, KEY, VAL = range(8)
 labels = ('ROOT', 'B_MAP', 'F_MAP', 'B_SEQ', 'F_SEQ', 'B_ENT', 'KEY', 'VAL')
 
 
+def DOCUMENT_STATE(conf):
+    # Detected indentation is kept from one document to the next
+    return ('spaces', 'indent-sequences')
+
+
 class Parent:
     def __init__(self, type, indent, line_indent=None):
         self.type = type
@@ -229,6 +237,13 @@ class Parent:
         return f'{labels[self.type]}:{self.indent}'
 
 
+@functools.lru_cache(maxsize=None)
+def unexpected_indent_pattern(indent):
+    # A line break followed by a line that is neither blank nor indented with
+    # exactly `indent` spaces
+    return re.compile(rf'\n(?! {{{indent}}}[^ \n]| *\n)')
+
+
 def check_scalar_indentation(conf, token, context):
     if token.start_mark.line == token.end_mark.line:
         return
@@ -283,18 +298,19 @@ def check_scalar_indentation(conf, token, context):
 
     line_no = token.start_mark.line + 1
 
+    buffer = token.start_mark.buffer
+    end = token.end_mark.pointer - 1
     line_start = token.start_mark.pointer
     while True:
-        line_start = token.start_mark.buffer.find(
-            '\n', line_start, token.end_mark.pointer - 1) + 1
+        line_start = buffer.find('\n', line_start, end) + 1
         if line_start == 0:
             break
         line_no += 1
 
         indent = 0
-        while token.start_mark.buffer[line_start + indent] == ' ':
+        while buffer[line_start + indent] == ' ':
             indent += 1
-        if token.start_mark.buffer[line_start + indent] == '\n':
+        if buffer[line_start + indent] == '\n':
             continue
 
         if expected_indent is None:
@@ -305,13 +321,23 @@ def check_scalar_indentation(conf, token, context):
                               f'wrong indentation: expected {expected_indent}'
                               f'but found {indent}')
 
+        # Skip all following lines that are correctly indented (or blank) at
+        # once, instead of counting their spaces one by one
+        mismatch = unexpected_indent_pattern(expected_indent).search(
+            buffer, line_start, end + expected_indent + 2)
+        if mismatch is None or mismatch.start() >= end:
+            break
+        line_no += buffer.count('\n', line_start, mismatch.start())
+        line_start = mismatch.start()
+
 
 def _check(conf, token, prev, next, nextnext, context):
     if 'stack' not in context:
         context['stack'] = [Parent(ROOT, 0)]
         context['cur_line'] = -1
-        context['spaces'] = conf['spaces']
-        context['indent-sequences'] = conf['indent-sequences']
+        # May have been detected in a previous document
+        context.setdefault('spaces', conf['spaces'])
+        context.setdefault('indent-sequences', conf['indent-sequences'])
 
     # Step 1: Lint
 
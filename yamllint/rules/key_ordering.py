@@ -106,9 +106,8 @@ to sort case and accents properly.
 """
 
 import re
-from locale import strcoll
-
-import yaml
+from locale import strxfrm
+from types import MappingProxyType
 
 from yamllint.linter import LintProblem
 
@@ -117,40 +116,24 @@ TYPE = 'token'
 
 CONF = {'ignored-keys': [str]}
 DEFAULT = {'ignored-keys': []}
-MAP, SEQ = range(2)
 
 
-class Parent:
-    def __init__(self, type):
-        self.type = type
-        self.keys = []
+def COMPILE(conf):
+    return MappingProxyType({
+        **conf,
+        'ignored-keys': tuple(re.compile(r) for r in conf['ignored-keys'])})
 
 
 def check(conf, token, prev, next, nextnext, context):
-    if 'stack' not in context:
-        context['stack'] = []
-
-    if isinstance(token, (yaml.BlockMappingStartToken,
-                          yaml.FlowMappingStartToken)):
-        context['stack'].append(Parent(MAP))
-    elif isinstance(token, (yaml.BlockSequenceStartToken,
-                            yaml.FlowSequenceStartToken)):
-        context['stack'].append(Parent(SEQ))
-    elif isinstance(token, (yaml.BlockEndToken,
-                            yaml.FlowMappingEndToken,
-                            yaml.FlowSequenceEndToken)):
-        context['stack'].pop()
-    elif (isinstance(token, yaml.KeyToken) and
-          isinstance(next, yaml.ScalarToken)):
-        # This check is done because KeyTokens can be found inside flow
-        # sequences... strange, but allowed.
-        if (len(context['stack']) > 0 and context['stack'][-1].type == MAP and
-                not any(re.search(r, next.value)
-                        for r in conf['ignored-keys'])):
-            if any(strcoll(next.value, key) < 0
-                   for key in context['stack'][-1].keys):
-                yield LintProblem(
-                    next.start_mark.line + 1, next.start_mark.column + 1,
-                    f'wrong ordering of key "{next.value}" in mapping')
-            else:
-                context['stack'][-1].keys.append(next.value)
+    structure = context['structure']
+    if (structure.key is not None and
+            not any(r.search(next.value) for r in conf['ignored-keys'])):
+        # Keys accepted so far are sorted, so comparing with the last one is
+        # enough. Sort keys are computed once per key with strxfrm().
+        sort_key = strxfrm(next.value)
+        if sort_key < structure.node.state.get(ID, sort_key):
+            yield LintProblem(
+                next.start_mark.line + 1, next.start_mark.column + 1,
+                f'wrong ordering of key "{next.value}" in mapping')
+        else:
+            structure.node.state[ID] = sort_key
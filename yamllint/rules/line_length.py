@@ -23,7 +23,11 @@ Use this rule to set a limit to lines length.
   spaces inside) to overflow the limit. This is useful for long URLs, for
   instance. Use ``true`` to allow, ``false`` to forbid.
 * ``allow-non-breakable-inline-mappings`` implies ``allow-non-breakable-words``
-  and extends it to also allow non-breakable words in inline mappings.
+  and extends it to also allow non-breakable words in inline mappings. Only
+  lines with a mapping entry starting on them are concerned, including
+  continuation lines of flow collections (like ``  , key: value}``): lines
+  inside block scalars and continuation lines of multi-line quoted or plain
+  scalars are text, even if they look like ``key: value``.
 
 .. rubric:: Default values (when enabled)
 
@@ -85,6 +89,18 @@ Use this rule to set a limit to lines length.
 
     - foobar: http://localhost/very/very/very/very/very/very/very/very/long/url
 
+   the following code snippet would **FAIL**:
+   ::
+
+    foobar: |
+      url: http://localhost/very/very/very/very/very/very/very/very/long/url
+
+   and the following code snippet would also **FAIL**:
+   ::
+
+    foobar: "first line
+      url: http://localhost/very/very/very/very/very/very/very/very/long/url"
+
 #. With ``line-length: {max: 60, allow-non-breakable-words: false}``
 
    the following code snippet would **FAIL**:
@@ -97,6 +113,8 @@ Use this rule to set a limit to lines length.
 """
 
 
+from types import MappingProxyType
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -111,7 +129,7 @@ DEFAULT = {'max': 80,
            'allow-non-breakable-inline-mappings': False}
 
 
-def check_inline_mapping(line):
+def check_inline_mapping_alone(line):
     loader = yaml.SafeLoader(line.content)
     try:
         while loader.peek_token():
@@ -128,10 +146,52 @@ def check_inline_mapping(line):
     return False
 
 
+def LINE_TOKENS(conf):
+    return conf['allow-non-breakable-inline-mappings']
+
+
+def check_inline_mapping(line):
+    if line.tokens is None:
+        return check_inline_mapping_alone(line)
+
+    tokens = line.tokens
+    for i, token in enumerate(tokens):
+        if isinstance(token, (yaml.KeyToken, yaml.ValueToken)):
+            break
+        elif not isinstance(token, (yaml.StreamStartToken,
+                                    yaml.BlockMappingStartToken,
+                                    yaml.BlockSequenceStartToken,
+                                    yaml.BlockEntryToken,
+                                    yaml.BlockEndToken,
+                                    yaml.AnchorToken,
+                                    yaml.TagToken,
+                                    # previous entries of a flow collection
+                                    yaml.FlowMappingStartToken,
+                                    yaml.FlowSequenceStartToken,
+                                    yaml.FlowEntryToken,
+                                    yaml.ScalarToken)):
+            return False
+    else:
+        return False
+
+    for token, next in zip(tokens[i:], tokens[i + 1:]):
+        if (isinstance(token, yaml.ValueToken) and
+                isinstance(next, yaml.ScalarToken)):
+            return ' ' not in line.content[next.start_mark.column:]
+
+    return False
+
+
+def COMPILE(conf):
+    return MappingProxyType({
+        **conf,
+        'allow-non-breakable-words': (
+            conf['allow-non-breakable-words'] or
+            conf['allow-non-breakable-inline-mappings'])})
+
+
 def check(conf, line):
     if line.end - line.start > conf['max']:
-        conf['allow-non-breakable-words'] |= \
-            conf['allow-non-breakable-inline-mappings']
         if conf['allow-non-breakable-words']:
             start = line.start
             while start < line.end and line.buffer[start] == ' ':
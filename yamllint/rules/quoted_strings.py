@@ -154,10 +154,12 @@ used.
 """
 
 import re
+from types import MappingProxyType
 
 import yaml
 
 from yamllint.linter import LintProblem
+from yamllint.rules.common import scalar_info
 
 ID = 'quoted-strings'
 TYPE = 'token'
@@ -204,52 +206,21 @@ def _quote_match(quote_type, token_style):
             (quote_type == 'double' and token_style == '"'))
 
 
-def _quotes_are_needed(string, style, is_inside_a_flow):
-    # Quotes needed on strings containing flow tokens
-    if is_inside_a_flow and set(string) & {',', '[', ']', '{', '}'}:
-        return True
-
-    if style == '"':
-        try:
-            yaml.reader.Reader('').check_printable('key: ' + string)
-        except yaml.reader.ReaderError:
-            # Special characters in a double-quoted string are assumed to have
-            # been backslash-escaped
-            return True
-
-    loader = yaml.BaseLoader('key: ' + string)
-    # Remove the 5 first tokens corresponding to 'key: ' (StreamStartToken,
-    # BlockMappingStartToken, KeyToken, ScalarToken(value=key), ValueToken)
-    for _ in range(5):
-        loader.get_token()
-    try:
-        a, b = loader.get_token(), loader.get_token()
-    except yaml.scanner.ScannerError:
-        return True
-    else:
-        if (isinstance(a, yaml.ScalarToken) and a.style is None and
-                isinstance(b, yaml.BlockEndToken) and a.value == string):
-            return False
-        return True
-
-
 def _has_quoted_quotes(token):
     return ((not token.plain) and
             ((token.style == "'" and '"' in token.value) or
              (token.style == '"' and "'" in token.value)))
 
 
-def check(conf, token, prev, next, nextnext, context):
-    if 'flow_nest_count' not in context:
-        context['flow_nest_count'] = 0
+def COMPILE(conf):
+    return MappingProxyType({
+        **conf,
+        'extra-required': tuple(re.compile(r)
+                                for r in conf['extra-required']),
+        'extra-allowed': tuple(re.compile(r) for r in conf['extra-allowed'])})
 
-    if isinstance(token, (yaml.FlowMappingStartToken,
-                          yaml.FlowSequenceStartToken)):
-        context['flow_nest_count'] += 1
-    elif isinstance(token, (yaml.FlowMappingEndToken,
-                            yaml.FlowSequenceEndToken)):
-        context['flow_nest_count'] -= 1
 
+def check(conf, token, prev, next, nextnext, context):
     if not (isinstance(token, yaml.tokens.ScalarToken) and
             isinstance(prev, (yaml.BlockEntryToken, yaml.FlowEntryToken,
                               yaml.FlowSequenceStartToken, yaml.TagToken,
@@ -267,8 +238,8 @@ def check(conf, token, prev, next, nextnext, context):
         return
 
     # Ignore numbers, booleans, etc.
-    resolver = yaml.resolver.Resolver()
-    tag = resolver.resolve(yaml.nodes.ScalarNode, token.value, (True, False))
+    info = scalar_info(token, context)
+    tag = info.implicit_tag
     if token.plain and tag != DEFAULT_SCALAR_TAG:
         return
 
@@ -297,7 +268,7 @@ def check(conf, token, prev, next, nextnext, context):
             msg = f"string {node} is not quoted with {quote_type} quotes"
 
         elif not token.style:
-            is_extra_required = any(re.search(r, token.value)
+            is_extra_required = any(r.search(token.value)
                                     for r in conf['extra-required'])
             if is_extra_required:
                 msg = f"string {node} is not quoted"
@@ -305,13 +276,12 @@ def check(conf, token, prev, next, nextnext, context):
     elif conf['required'] == 'only-when-needed':
 
         # Quotes are not strictly needed here
+        is_inside_a_flow = context['structure'].flow_depth > 0
         if (token.style and tag == DEFAULT_SCALAR_TAG and token.value and
-                not _quotes_are_needed(token.value,
-                                       token.style,
-                                       context['flow_nest_count'] > 0)):
-            is_extra_required = any(re.search(r, token.value)
+                not info.quotes_are_needed(is_inside_a_flow)):
+            is_extra_required = any(r.search(token.value)
                                     for r in conf['extra-required'])
-            is_extra_allowed = any(re.search(r, token.value)
+            is_extra_allowed = any(r.search(token.value)
                                    for r in conf['extra-allowed'])
             if not (is_extra_required or is_extra_allowed):
                 msg = f"string {node} is redundantly quoted with " \
@@ -324,8 +294,8 @@ def check(conf, token, prev, next, nextnext, context):
             msg = f"string {node} is not quoted with {quote_type} quotes"
 
         elif not token.style:
-            is_extra_required = len(conf['extra-required']) and any(
-                re.search(r, token.value) for r in conf['extra-required'])
+            is_extra_required = any(r.search(token.value)
+                                    for r in conf['extra-required'])
             if is_extra_required:
                 msg = f"string {node} is not quoted"
 
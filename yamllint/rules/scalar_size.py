@@ -0,0 +1,112 @@
+# Copyright (C) 2026 the yamllint contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Use this rule to report oversized scalars, like whole binary files encoded in
+a string.
+
+To skip files that are too big altogether, see the ``max-file-size`` setting
+in :doc:`configuration <configuration>`.
+
+.. rubric:: Options
+
+* ``max-bytes`` is the maximum size of a scalar value, in bytes once encoded
+  in UTF-8. Set it to ``false`` to only check lines.
+* ``max-lines`` is the maximum number of lines a scalar can span in the
+  source, including the line of its ``|`` or ``>`` indicator for block
+  scalars. Set it to ``false`` to only check sizes.
+
+.. rubric:: Default values (when enabled)
+
+.. code-block:: yaml
+
+ rules:
+   scalar-size:
+     max-bytes: 65536
+     max-lines: 1000
+
+.. rubric:: Examples
+
+#. With ``scalar-size: {max-bytes: 10}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    key: short
+
+   the following code snippet would **FAIL**:
+   ::
+
+    key: a much longer value
+
+#. With ``scalar-size: {max-lines: 3}``
+
+   the following code snippet would **PASS**:
+   ::
+
+    key: |
+      line 1
+      line 2
+
+   the following code snippet would **FAIL**:
+   ::
+
+    key: |
+      line 1
+      line 2
+      line 3
+"""
+
+
+import yaml
+
+from yamllint.linter import LintProblem
+
+ID = 'scalar-size'
+TYPE = 'token'
+CONF = {'max-bytes': (False, int),
+        'max-lines': (False, int)}
+DEFAULT = {'max-bytes': 65536,
+           'max-lines': 1000}
+
+
+def VALIDATE(conf):
+    for option in CONF:
+        if conf[option] is not False and conf[option] < 0:
+            return f'"{option}" should be a non-negative number or false'
+
+
+def check(conf, token, prev, next, nextnext, context):
+    if not isinstance(token, yaml.ScalarToken):
+        return
+
+    max_bytes = conf['max-bytes']
+    # A character takes at most 4 bytes in UTF-8: only encode when needed
+    if max_bytes is not False and 4 * len(token.value) > max_bytes:
+        size = (len(token.value) if token.value.isascii()
+                else len(token.value.encode('utf-8', 'surrogatepass')))
+        if size > max_bytes:
+            yield LintProblem(
+                token.start_mark.line + 1, token.start_mark.column + 1,
+                f'scalar too big ({size} > {max_bytes} bytes)')
+
+    if conf['max-lines'] is not False:
+        end = token.end_mark
+        # Block scalars end at the start of the line following them
+        lines = end.line - token.start_mark.line + (end.column > 0)
+        if lines > conf['max-lines']:
+            yield LintProblem(
+                token.start_mark.line + 1, token.start_mark.column + 1,
+                f'scalar too long ({lines} > {conf["max-lines"]} lines)')
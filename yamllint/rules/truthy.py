@@ -139,6 +139,9 @@ directive can be used (see example below).
     true: True
 """
 
+import re
+from types import MappingProxyType
+
 import yaml
 
 from yamllint.linter import LintProblem
@@ -159,6 +162,27 @@ CONF = {'allowed-values': TRUTHY_1_1.copy(), 'check-keys': bool}
 DEFAULT = {'allowed-values': ['true', 'false'], 'check-keys': True}
 
 
+def COMPILE(conf):
+    allowed = frozenset(conf['allowed-values'])
+    return MappingProxyType({
+        **conf,
+        'bad-values-1.1': frozenset(TRUTHY_1_1) - allowed,
+        'bad-values-1.2': frozenset(TRUTHY_1_2) - allowed,
+        'message': ('truthy value should be one of [' +
+                    ', '.join(sorted(conf['allowed-values'])) + ']')})
+
+
+def PREFILTER(conf):
+    # Values forbidden in YAML 1.2 are also forbidden in YAML 1.1
+    bad_values = set(TRUTHY_1_1) - set(conf['allowed-values'])
+    # Words are checked to start on a word boundary after they matched, so
+    # that the regular expression engine can quickly skip to their first
+    # letters
+    return re.compile(
+        '(?:' + '|'.join(rf'{value}(?<!\w{value})'
+                         for value in sorted(bad_values)) + r')\b')
+
+
 def yaml_spec_version_for_document(context):
     if 'yaml_spec_version' in context:
         return context['yaml_spec_version']
@@ -170,7 +194,6 @@ def check(conf, token, prev, next, nextnext, context):
         context['yaml_spec_version'] = token.value
     elif isinstance(token, yaml.tokens.DocumentEndToken):
         context.pop('yaml_spec_version', None)
-        context.pop('bad_truthy_values', None)
 
     if prev and isinstance(prev, yaml.tokens.TagToken):
         return
@@ -180,14 +203,11 @@ def check(conf, token, prev, next, nextnext, context):
         return
 
     if isinstance(token, yaml.tokens.ScalarToken) and token.style is None:
-        if 'bad_truthy_values' not in context:
-            context['bad_truthy_values'] = set(
-                TRUTHY_1_2 if yaml_spec_version_for_document(context) == (1, 2)
-                else TRUTHY_1_1)
-            context['bad_truthy_values'] -= set(conf['allowed-values'])
+        bad_values = (conf['bad-values-1.2']
+                      if yaml_spec_version_for_document(context) == (1, 2)
+                      else conf['bad-values-1.1'])
 
-        if token.value in context['bad_truthy_values']:
+        if token.value in bad_values:
             yield LintProblem(token.start_mark.line + 1,
                               token.start_mark.column + 1,
-                              "truthy value should be one of [" +
-                              ", ".join(sorted(conf['allowed-values'])) + "]")
+                              conf['message'])